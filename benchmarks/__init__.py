@@ -0,0 +1 @@
+# Benchmarks module for measuring rendering cost of the portfolio
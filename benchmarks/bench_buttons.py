@@ -0,0 +1,83 @@
+"""
+Benchmark de renderização dos botões customizados.
+
+Compara o modo "iframe" (um components.html por botão) com o modo "inline"
+(HTML via st.markdown) executando o app com o AppTest do Streamlit em cada
+seção que contém botões. Para cada modo são reportados a quantidade de iframes,
+a quantidade de elementos emitidos e o tempo de execução do script. Cada iframe
+corresponde a um documento extra que o navegador precisa carregar e diagramar
+antes de a página ficar interativa.
+
+As listas de Recomendações e Conteúdos não entram na comparação: seus botões
+fazem parte do bloco HTML de cada página (components/listings.py), são sempre
+inline e não dependem de BUTTON_RENDER_MODE.
+
+Uso:
+    python -m benchmarks.bench_buttons [--runs 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+import components.buttons as buttons
+from benchmarks.common import APP_PATH, count_elements
+
+
+# Seções do app com botões avulsos (create_custom_button), afetados pelo modo
+BUTTON_SECTIONS = ("mentorship", "contact")
+
+
+def measure_section(section: str, mode: str, runs: int) -> dict:
+    """
+    Mede a renderização de uma seção em um modo de botões.
+    
+    Args:
+        section: Seção a ser renderizada
+        mode: Modo de renderização dos botões ("inline" ou "iframe")
+        runs: Número de reruns medidos
+    
+    Returns:
+        dict: Contagem de iframes e elementos e mediana do tempo de rerun em ms
+    """
+    buttons.BUTTON_RENDER_MODE = mode
+    at = AppTest.from_file(APP_PATH, default_timeout=30).run()
+    at.sidebar.radio[0].set_value(section).run()
+    
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+    
+    return {
+        "iframes": count_elements(at._tree, "iframe"),
+        "elements": count_elements(at._tree),
+        "rerun_ms": statistics.median(timings)
+    }
+
+
+def main() -> None:
+    """Executa o benchmark e imprime a comparação entre os modos."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Reruns medidos por seção")
+    args = parser.parse_args()
+    
+    original_mode = buttons.BUTTON_RENDER_MODE
+    print(f"{'section':<16}{'mode':<8}{'iframes':>8}{'elements':>10}{'rerun_ms':>10}")
+    try:
+        for section in BUTTON_SECTIONS:
+            for mode in ("iframe", "inline"):
+                result = measure_section(section, mode, args.runs)
+                print(
+                    f"{section:<16}{mode:<8}{result['iframes']:>8}"
+                    f"{result['elements']:>10}{result['rerun_ms']:>10.2f}"
+                )
+    finally:
+        buttons.BUTTON_RENDER_MODE = original_mode
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark de tempo de CPU por interação com reruns parciais (fragmentos).
+
+Antes do uso de st.fragment, qualquer interação dentro de uma seção (trocar o
+filtro, mudar de página) reexecutava o script inteiro: setup_page, sidebar e
+seção. Com cada seção registrada como fragmento, a mesma interação reexecuta
+apenas a função da seção.
+
+O AppTest do Streamlit sempre reexecuta o script completo, então os dois casos
+são medidos separadamente: "full" executa app.py inteiro (custo antes) e
+"fragment" executa apenas a função da seção (custo depois). Os valores são a
+mediana do tempo de CPU do processo (time.process_time) por rerun.
+
+Uso:
+    python -m benchmarks.bench_fragments [--runs 20]
+"""
+
+import argparse
+import statistics
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.common import APP_PATH
+
+
+# Interações medidas: (seção, chave do widget, valor)
+INTERACTIONS = (
+    ("recommendations", "recommendations_filter_selector", "book"),
+    ("content", "content_filter_selector", "article"),
+)
+
+# Script que executa apenas a função de uma seção, como em um rerun do fragmento
+FRAGMENT_SCRIPT = """
+from data.translations import get_catalog
+from sections import get_section_renderer
+get_section_renderer("{section}")("pt", get_catalog("pt"))
+"""
+
+
+def measure_cpu(at: AppTest, key: str, value, runs: int) -> float:
+    """
+    Mede a mediana do tempo de CPU (ms) de uma interação repetida.
+    
+    Args:
+        at: AppTest já executado uma vez
+        key: Chave do widget alterado
+        value: Novo valor do widget
+        runs: Número de reruns medidos
+    
+    Returns:
+        float: Mediana do tempo de CPU em milissegundos
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.process_time()
+        at.selectbox(key=key).set_value(value).run()
+        timings.append((time.process_time() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    """Executa o benchmark e imprime o tempo de CPU antes e depois."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Reruns medidos por interação")
+    args = parser.parse_args()
+    
+    print(f"{'interaction':<34}{'full_cpu_ms':>12}{'fragment_cpu_ms':>16}")
+    for section, key, value in INTERACTIONS:
+        full = AppTest.from_file(APP_PATH, default_timeout=30).run()
+        full.sidebar.radio[0].set_value(section).run()
+        full_ms = measure_cpu(full, key, value, args.runs)
+        
+        fragment = AppTest.from_string(FRAGMENT_SCRIPT.format(section=section), default_timeout=30).run()
+        fragment_ms = measure_cpu(fragment, key, value, args.runs)
+        
+        print(f"{key:<34}{full_ms:>12.2f}{fragment_ms:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Benchmark de carga do app com várias sessões simuladas.
+
+Cada sessão é uma instância do AppTest do Streamlit (estado de sessão próprio)
+que executa um roteiro de interações: troca de seção, troca de idioma e troca
+de filtro. As sessões são intercaladas em rodadas e cada rerun é cronometrado.
+
+O relatório contém latência de rerun (p50/p95/p99) por tipo de interação,
+tempo de CPU por rerun, memória por sessão (tracemalloc) e uma estimativa de
+sessões por núcleo, dado um intervalo médio entre interações de um usuário.
+Com --output o relatório é gravado em JSON junto com o commit atual; com
+--compare ele é comparado a um relatório anterior e o comando termina com
+código de saída 1 se alguma métrica piorar além da tolerância.
+
+Uso:
+    python -m benchmarks.bench_load [--sessions 20] [--rounds 3]
+        [--output report.json] [--compare baseline.json] [--tolerance 0.2]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.common import APP_PATH, compare_reports, percentile
+
+
+# Roteiro de interações de cada sessão: (tipo, função que aplica a interação)
+SCENARIO = (
+    ("section", lambda at: at.radio(key="section_selector").set_value("projects")),
+    ("section", lambda at: at.radio(key="section_selector").set_value("recommendations")),
+    ("filter", lambda at: at.selectbox(key="recommendations_filter_selector").set_value("book")),
+    ("section", lambda at: at.radio(key="section_selector").set_value("content")),
+    ("filter", lambda at: at.selectbox(key="content_filter_selector").set_value("article")),
+    ("language", lambda at: at.selectbox(key="language_selector").set_value("en")),
+    ("section", lambda at: at.radio(key="section_selector").set_value("mentorship")),
+    ("section", lambda at: at.radio(key="section_selector").set_value("contact")),
+    ("language", lambda at: at.selectbox(key="language_selector").set_value("pt")),
+    ("section", lambda at: at.radio(key="section_selector").set_value("about")),
+)
+
+# Métricas comparadas entre relatórios (maior = pior)
+TRACKED_METRICS = ("p50_ms", "p95_ms", "p99_ms", "cpu_ms_per_rerun", "memory_kb_per_session")
+
+
+def new_session() -> AppTest:
+    """Cria uma sessão simulada e executa a carga inicial da página."""
+    return AppTest.from_file(APP_PATH, default_timeout=30).run()
+
+
+def run_load(sessions: int, rounds: int) -> dict:
+    """
+    Executa o roteiro em todas as sessões e coleta latências e tempo de CPU.
+
+    Args:
+        sessions: Número de sessões simuladas
+        rounds: Número de vezes que cada sessão executa o roteiro
+
+    Returns:
+        dict: Latências por tipo de interação (ms), total de reruns e tempo de CPU
+    """
+    latencies: dict[str, list[float]] = {"initial": []}
+    cpu_start = time.process_time()
+
+    active = []
+    for _ in range(sessions):
+        start = time.perf_counter()
+        active.append(new_session())
+        latencies["initial"].append((time.perf_counter() - start) * 1000)
+
+    for _ in range(rounds):
+        for interaction, apply in SCENARIO:
+            for at in active:
+                start = time.perf_counter()
+                apply(at).run()
+                latencies.setdefault(interaction, []).append((time.perf_counter() - start) * 1000)
+                if at.exception:
+                    raise RuntimeError(f"Erro no app durante '{interaction}': {at.exception}")
+
+    reruns = sum(len(values) for values in latencies.values())
+    return {
+        "latencies": latencies,
+        "reruns": reruns,
+        "cpu_ms": (time.process_time() - cpu_start) * 1000
+    }
+
+
+def measure_memory(sessions: int) -> float:
+    """
+    Mede a memória alocada por sessão mantida viva.
+
+    Args:
+        sessions: Número de sessões criadas para a medição
+
+    Returns:
+        float: Memória média por sessão em KB
+    """
+    new_session()  # aquece caches compartilhados do processo antes de medir
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    active = []
+    for _ in range(sessions):
+        at = new_session()
+        for _, apply in SCENARIO:
+            apply(at).run()
+        active.append(at)
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return used / sessions / 1024
+
+
+def build_report(sessions: int, rounds: int, memory_sessions: int, think_time: float) -> dict:
+    """
+    Executa o benchmark completo e monta o relatório.
+
+    Args:
+        sessions: Número de sessões simuladas
+        rounds: Repetições do roteiro por sessão
+        memory_sessions: Número de sessões usadas na medição de memória
+        think_time: Intervalo médio (s) entre interações de um usuário real
+
+    Returns:
+        dict: Relatório com métricas gerais e por tipo de interação
+    """
+    load = run_load(sessions, rounds)
+    all_latencies = [value for values in load["latencies"].values() for value in values]
+    cpu_ms_per_rerun = load["cpu_ms"] / load["reruns"]
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "sessions": sessions,
+        "rounds": rounds,
+        "reruns": load["reruns"],
+        "p50_ms": percentile(all_latencies, 50),
+        "p95_ms": percentile(all_latencies, 95),
+        "p99_ms": percentile(all_latencies, 99),
+        "cpu_ms_per_rerun": cpu_ms_per_rerun,
+        "memory_kb_per_session": measure_memory(memory_sessions),
+        # Um núcleo atende 1000 / cpu_ms reruns por segundo; cada sessão gera
+        # um rerun a cada think_time segundos
+        "sessions_per_core": 1000 / cpu_ms_per_rerun * think_time,
+        "interactions": {
+            interaction: {
+                "count": len(values),
+                "mean_ms": statistics.fmean(values),
+                "p50_ms": percentile(values, 50),
+                "p95_ms": percentile(values, 95),
+                "p99_ms": percentile(values, 99)
+            }
+            for interaction, values in load["latencies"].items()
+        }
+    }
+
+
+def print_report(report: dict) -> None:
+    """Imprime o relatório em formato de tabela."""
+    print(f"commit {report['commit']} | {report['sessions']} sessions x {report['rounds']} rounds"
+          f" | {report['reruns']} reruns")
+    print(f"{'interaction':<12}{'count':>7}{'p50_ms':>9}{'p95_ms':>9}{'p99_ms':>9}")
+    for interaction, stats in report["interactions"].items():
+        print(f"{interaction:<12}{stats['count']:>7}{stats['p50_ms']:>9.2f}"
+              f"{stats['p95_ms']:>9.2f}{stats['p99_ms']:>9.2f}")
+    print(f"{'all':<12}{report['reruns']:>7}{report['p50_ms']:>9.2f}"
+          f"{report['p95_ms']:>9.2f}{report['p99_ms']:>9.2f}")
+    print(f"cpu per rerun: {report['cpu_ms_per_rerun']:.2f} ms")
+    print(f"memory per session: {report['memory_kb_per_session']:.1f} KB")
+    print(f"sessions per core: {report['sessions_per_core']:.0f}")
+
+
+def main() -> int:
+    """Executa o benchmark pela linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="Sessões simuladas")
+    parser.add_argument("--rounds", type=int, default=3, help="Repetições do roteiro por sessão")
+    parser.add_argument("--memory-sessions", type=int, default=5, help="Sessões na medição de memória")
+    parser.add_argument("--think-time", type=float, default=10.0,
+                        help="Intervalo médio (s) entre interações de um usuário")
+    parser.add_argument("--output", help="Grava o relatório em JSON neste arquivo")
+    parser.add_argument("--compare", help="Relatório JSON de referência para detectar regressões")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Piora relativa aceita")
+    args = parser.parse_args()
+
+    report = build_report(args.sessions, args.rounds, args.memory_sessions, args.think_time)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare_reports(report, json.load(file), args.tolerance, TRACKED_METRICS)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
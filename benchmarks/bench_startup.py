@@ -0,0 +1,155 @@
+"""
+Benchmark de inicialização (cold start) do app.
+
+Cada medição executa um interpretador novo com python -X importtime e lê, da
+saída de erro, o tempo de importação de cada módulo. O relatório contém o
+tempo total de "import app", a parte gasta nos módulos do próprio portfólio
+(app, data, components e sections), os módulos mais lentos e o custo adicional
+de importar cada seção na primeira vez em que ela é exibida.
+
+Com --output o relatório é gravado em JSON; com --compare ele é comparado a um
+relatório anterior e o comando termina com código de saída 1 se o tempo de
+inicialização piorar além da tolerância.
+
+Uso:
+    python -m benchmarks.bench_startup [--runs 5] [--top 10]
+        [--output report.json] [--compare baseline.json] [--tolerance 0.2]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from benchmarks.common import compare_reports
+from sections import SECTIONS
+
+
+# Diretório raiz do repositório, de onde os interpretadores são executados
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Pacotes do próprio portfólio, separados das dependências no relatório
+OWN_PACKAGES = ("app", "data", "components", "sections")
+
+# Métricas comparadas entre relatórios (maior = pior)
+TRACKED_METRICS = ("import_app_ms", "own_modules_ms")
+
+
+def import_times(statement: str) -> dict[str, tuple[int, int, int]]:
+    """
+    Executa uma instrução em um interpretador novo e coleta os tempos de importação.
+
+    Args:
+        statement: Código Python executado com -X importtime
+
+    Returns:
+        dict: Módulo -> (nível de aninhamento, tempo próprio em µs, tempo acumulado em µs)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # cabeçalho
+        name = name[1:]
+        module = name.lstrip()
+        times[module] = ((len(name) - len(module)) // 2, int(self_us), int(cumulative_us))
+    return times
+
+
+def is_own_module(module: str) -> bool:
+    """Indica se o módulo pertence ao portfólio."""
+    return module.split(".")[0] in OWN_PACKAGES
+
+
+def build_report(runs: int, top: int) -> dict:
+    """
+    Executa as medições e monta o relatório com a mediana de cada tempo.
+
+    Args:
+        runs: Interpretadores executados por medição
+        top: Quantidade de módulos mais lentos listados
+
+    Returns:
+        dict: Relatório com tempos de inicialização e custo de cada seção
+    """
+    app_runs = [import_times("import app") for _ in range(runs)]
+    import_app_ms = statistics.median(times["app"][2] for times in app_runs) / 1000
+    own_modules_ms = statistics.median(
+        sum(self_us for module, (_, self_us, _) in times.items() if is_own_module(module))
+        for times in app_runs
+    ) / 1000
+
+    last = app_runs[-1]
+    slowest = sorted(
+        ((module, cumulative_us / 1000) for module, (level, _, cumulative_us) in last.items() if level <= 1),
+        key=lambda item: item[1],
+        reverse=True
+    )[:top]
+
+    # Custo de importar o módulo de cada seção depois do app já carregado
+    sections_ms = {}
+    for section, (module_name, _) in SECTIONS.items():
+        samples = []
+        for _ in range(runs):
+            times = import_times(f"import app; import {module_name}")
+            samples.append(times[module_name][2] / 1000)
+        sections_ms[section] = statistics.median(samples)
+
+    return {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "import_app_ms": import_app_ms,
+        "own_modules_ms": own_modules_ms,
+        "slowest_modules": dict(slowest),
+        "sections_ms": sections_ms
+    }
+
+
+def print_report(report: dict) -> None:
+    """Imprime o relatório em formato de tabela."""
+    print(f"import app: {report['import_app_ms']:.1f} ms "
+          f"(portfolio modules: {report['own_modules_ms']:.1f} ms, median of {report['runs']} runs)")
+    print(f"{'module':<48}{'cumulative_ms':>14}")
+    for module, cumulative_ms in report["slowest_modules"].items():
+        print(f"{module:<48}{cumulative_ms:>14.1f}")
+    print(f"{'first render import':<48}{'cumulative_ms':>14}")
+    for section, cumulative_ms in report["sections_ms"].items():
+        print(f"{'sections: ' + section:<48}{cumulative_ms:>14.1f}")
+
+
+def main() -> int:
+    """Executa o benchmark pela linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Interpretadores executados por medição")
+    parser.add_argument("--top", type=int, default=10, help="Módulos mais lentos listados")
+    parser.add_argument("--output", help="Grava o relatório em JSON neste arquivo")
+    parser.add_argument("--compare", help="Relatório JSON de referência para detectar regressões")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Piora relativa aceita")
+    args = parser.parse_args()
+
+    report = build_report(args.runs, args.top)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            regressions = compare_reports(report, json.load(file), args.tolerance, TRACKED_METRICS)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
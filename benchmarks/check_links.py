@@ -0,0 +1,150 @@
+"""
+Verificação de regressão: verificador de links contra um servidor HTTP local.
+
+Inicia um servidor http.server em 127.0.0.1 com respostas conhecidas e verifica
+o LinkChecker (check_links.py) em cada caso: 200, redirecionamento 301, 404,
+HEAD recusado com 405 (repetido com GET), conexão recusada, 304 em uma segunda
+execução com o cache de validadores e conexão keep-alive fechada pelo servidor
+enquanto estava ociosa no pool. O comando termina com código de saída 1 se
+algum caso falhar.
+
+Uso:
+    python -m benchmarks.check_links
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from check_links import LinkChecker
+
+
+# ETag devolvida por /ok
+ETAG = '"v1"'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Servidor de teste: o caminho define a resposta."""
+
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+
+    def _reply(self, send_body: bool) -> None:
+        _StubHandler.connections.add(self.client_address[1])
+        body = b"ok"
+        if self.path == "/ok" and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path in ("/ok", "/drop"):
+            self.send_response(200)
+            self.send_header("ETag", ETAG)
+        elif self.path == "/moved":
+            self.send_response(301)
+            self.send_header("Location", "/ok")
+        elif self.path == "/no-head" and self.command == "HEAD":
+            self.send_response(405)
+        elif self.path == "/no-head":
+            self.send_response(200)
+        else:
+            self.send_response(404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+        if self.path == "/drop":
+            # Fecha a conexão sem avisar (sem Connection: close), como um
+            # servidor que encerra conexões keep-alive ociosas
+            self.close_connection = True
+
+    def do_HEAD(self) -> None:
+        self._reply(send_body=False)
+
+    def do_GET(self) -> None:
+        self._reply(send_body=True)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def _closed_port() -> int:
+    """Retorna uma porta local sem servidor (conexões são recusadas)."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _check(checker: LinkChecker, urls: list[str]) -> dict:
+    """Verifica as URLs e retorna URL -> LinkResult."""
+    return {result.url: result for result in asyncio.run(checker.run(urls))}
+
+
+def run_cases(base_url: str) -> list[tuple[str, bool, str]]:
+    """
+    Executa os casos contra o servidor de teste.
+
+    Args:
+        base_url: URL do servidor de teste (ex: http://127.0.0.1:8000)
+
+    Returns:
+        list: (caso, passou, detalhe) para cada caso
+    """
+    refused_url = f"http://127.0.0.1:{_closed_port()}/"
+    urls = [base_url + path for path in ("/ok", "/moved", "/missing", "/no-head")] + [refused_url]
+    cache: dict = {}
+    first = _check(LinkChecker(cache, host_interval=0, timeout=2), urls)
+    second = _check(LinkChecker(cache, host_interval=0, timeout=2), [base_url + "/ok"])
+
+    # Uma conexão por host: /drop deixa no pool uma conexão que o servidor já fechou
+    _StubHandler.connections.clear()
+    stale = _check(
+        LinkChecker(connections_per_host=1, host_interval=0, timeout=2),
+        [base_url + "/drop", base_url + "/ok"]
+    )
+
+    ok, moved, missing, no_head, refused = (first[url] for url in urls)
+    not_modified = second[base_url + "/ok"]
+    return [
+        ("200", ok.status == 200 and ok.ok, f"status {ok.status}"),
+        ("301 -> 200", moved.status == 200 and moved.final_url == base_url + "/ok",
+         f"status {moved.status}, final {moved.final_url}"),
+        ("404", missing.status == 404 and not missing.ok, f"status {missing.status}"),
+        ("405 on HEAD -> GET", no_head.status == 200, f"status {no_head.status}"),
+        ("connection refused", refused.status is None and "Refused" in refused.error,
+         refused.error or f"status {refused.status}"),
+        ("304 with cached ETag", not_modified.not_modified and not_modified.status == 200,
+         f"status {not_modified.status}, not_modified {not_modified.not_modified}"),
+        ("stale keep-alive retried", all(result.ok for result in stale.values())
+         and len(_StubHandler.connections) == 2,
+         ", ".join(f"{result.status or result.error}" for result in stale.values())),
+    ]
+
+
+def main() -> int:
+    """
+    Executa os casos e imprime o resultado de cada um.
+
+    Returns:
+        int: Código de saída (0 se todos os casos passaram)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        cases = run_cases(f"http://127.0.0.1:{server.server_port}")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    failures = 0
+    for name, passed, detail in cases:
+        failures += not passed
+        print(f"{name:<28}{'ok' if passed else 'FAIL':<6}{detail}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Verificação de regressão: tamanho das mensagens (deltas) enviadas por seção.
+
+Cada seção é renderizada em cada idioma com a instrumentação ativa
+(PORTFOLIO_PROFILING=1), que soma os bytes das mensagens protobuf emitidas pela
+seção e o tamanho estimado após a compressão permessage-deflate do WebSocket.
+O comando termina com código de saída 1 se alguma seção exceder seu orçamento
+de bytes (sem compressão, o pior caso para clientes sem permessage-deflate).
+
+Uso:
+    python -m benchmarks.check_payload
+"""
+
+import os
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.common import APP_PATH
+from components.instrumentation import RUN_KEY
+
+
+# Orçamento de bytes por rerun de cada seção (deltas sem compressão).
+# Recomendações e conteúdos são paginados: o orçamento cobre uma página cheia.
+PAYLOAD_BUDGETS = {
+    "about": 8 * 1024,
+    "projects": 16 * 1024,
+    "mentorship": 6 * 1024,
+    "recommendations": 12 * 1024,
+    "content": 12 * 1024,
+    "contact": 4 * 1024,
+}
+
+# Idiomas verificados
+LANGUAGES = ("pt", "en")
+
+
+def measure_sections() -> list[tuple[str, str, dict]]:
+    """
+    Renderiza cada seção em cada idioma e coleta as estatísticas da instrumentação.
+
+    Returns:
+        list: (idioma, seção, estatísticas da etapa section:<seção>)
+    """
+    os.environ["PORTFOLIO_PROFILING"] = "1"
+    at = AppTest.from_file(APP_PATH, default_timeout=30).run()
+    measurements = []
+    for language in LANGUAGES:
+        at.selectbox(key="language_selector").set_value(language).run()
+        for section in PAYLOAD_BUDGETS:
+            at.radio(key="section_selector").set_value(section).run()
+            if at.exception:
+                raise RuntimeError(f"Erro no app na seção '{section}': {at.exception}")
+            measurements.append((language, section, at.session_state[RUN_KEY][f"section:{section}"]))
+    return measurements
+
+
+def main() -> int:
+    """
+    Compara os bytes de cada seção com o orçamento.
+
+    Returns:
+        int: Código de saída (0 se todas as seções estão dentro do orçamento)
+    """
+    failures = 0
+    print(f"{'section':<20}{'elements':>9}{'bytes':>8}{'deflate':>9}{'ratio':>7}{'budget':>8}")
+    for language, section, stats in measure_sections():
+        budget = PAYLOAD_BUDGETS[section]
+        status = "ok" if stats["bytes"] <= budget else "FAIL"
+        failures += status == "FAIL"
+        ratio = stats["deflate_bytes"] / stats["bytes"] if stats["bytes"] else 0.0
+        print(f"{language + ' ' + section:<20}{stats['elements']:>9}{stats['bytes']:>8}"
+              f"{stats['deflate_bytes']:>9}{ratio:>7.0%}{budget:>8}  {status}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
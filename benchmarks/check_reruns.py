@@ -0,0 +1,66 @@
+"""
+Verificação de regressão: execuções do script por interação.
+
+Cada interação do usuário no sidebar (trocar idioma ou seção) deve produzir
+exatamente uma execução do script. As execuções são contadas pelas chamadas a
+st.set_page_config, feitas uma vez por execução em setup_page. O comando
+termina com código de saída 1 se alguma interação produzir mais ou menos
+execuções que o esperado (zero execuções também é falha).
+
+Uso:
+    python -m benchmarks.check_reruns
+"""
+
+import sys
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.common import APP_PATH
+
+
+# Interações verificadas: (descrição, função que aplica a interação)
+INTERACTIONS = (
+    ("language pt -> en", lambda at: at.selectbox(key="language_selector").set_value("en")),
+    ("language en -> pt", lambda at: at.selectbox(key="language_selector").set_value("pt")),
+    ("section about -> content", lambda at: at.radio(key="section_selector").set_value("content")),
+    ("section content -> contact", lambda at: at.radio(key="section_selector").set_value("contact")),
+)
+
+# Número exato de execuções do script esperado por interação
+EXPECTED_EXECUTIONS = 1
+
+
+def main() -> int:
+    """
+    Executa as interações e compara as execuções contadas com o esperado.
+    
+    Returns:
+        int: Código de saída (0 se todas as interações produziram o esperado)
+    """
+    executions = 0
+    set_page_config = st.set_page_config
+    
+    def counting_set_page_config(*args, **kwargs):
+        nonlocal executions
+        executions += 1
+        return set_page_config(*args, **kwargs)
+    
+    st.set_page_config = counting_set_page_config
+    failures = 0
+    try:
+        at = AppTest.from_file(APP_PATH, default_timeout=30).run()
+        for description, interact in INTERACTIONS:
+            executions = 0
+            interact(at).run()
+            status = "ok" if executions == EXPECTED_EXECUTIONS else "FAIL"
+            failures += status == "FAIL"
+            print(f"{description:<28}{executions:>3} execution(s)  {status}")
+    finally:
+        st.set_page_config = set_page_config
+    
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Utilitários compartilhados pelos benchmarks do portfólio.
+"""
+
+import os
+
+
+# Caminho do script principal do app
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def count_elements(node, element_type: str | None = None) -> int:
+    """
+    Conta recursivamente os elementos da árvore do AppTest.
+    
+    Args:
+        node: Nó raiz da árvore
+        element_type: Tipo de elemento a contar (opcional). Se None, conta todos.
+    
+    Returns:
+        int: Quantidade de elementos encontrados
+    """
+    total = 0
+    if element_type is None or getattr(node, "type", None) == element_type:
+        total += 1
+    for child in getattr(node, "children", {}).values():
+        total += count_elements(child, element_type)
+    return total
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """
+    Calcula o percentil de uma lista de valores (interpolação linear).
+    
+    Args:
+        values: Valores medidos
+        percent: Percentil desejado (0 a 100)
+    
+    Returns:
+        float: Valor do percentil ou 0.0 se a lista estiver vazia
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def compare_reports(current: dict, baseline: dict, tolerance: float, metrics: tuple[str, ...]) -> list[str]:
+    """
+    Compara dois relatórios e lista as métricas que pioraram além da tolerância.
+
+    Args:
+        current: Relatório atual
+        baseline: Relatório de referência
+        tolerance: Piora relativa aceita (ex: 0.2 = 20%)
+        metrics: Métricas comparadas (maior = pior)
+
+    Returns:
+        list[str]: Descrição de cada regressão encontrada
+    """
+    regressions = []
+    for metric in metrics:
+        before, after = baseline.get(metric), current.get(metric)
+        if before and after is not None and after > before * (1 + tolerance):
+            regressions.append(
+                f"{metric}: {before:.2f} -> {after:.2f} (+{(after / before - 1) * 100:.0f}%)"
+            )
+    return regressions
@@ -0,0 +1,402 @@
+"""
+Verificação dos links externos do portfólio.
+
+Coleta todas as URLs de projetos, conteúdos, recomendações, mentoria e contato
+(data/portfolio.jsonl) e verifica cada uma concorrentemente com asyncio. As
+requisições HTTP usam http.client em threads do executor padrão, com um pool de
+conexões keep-alive por host, um limite de conexões simultâneas por host e um
+intervalo mínimo entre requisições ao mesmo host, para não sobrecarregar
+sites como Medium ou Amazon.
+
+Os validadores de cada resposta (ETag e Last-Modified) ficam em um arquivo de
+cache: na execução seguinte as requisições são condicionais e uma resposta 304
+reaproveita o resultado anterior sem baixar nada. O relatório lista o status
+de cada link e de onde ele vem; o comando termina com código de saída 1 se
+algum link estiver quebrado.
+
+Uso:
+    python check_links.py [--output links-report.json] [--cache .cache/links.json]
+        [--concurrency 16] [--per-host 2] [--host-interval 0.5]
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import sys
+import time
+from typing import NamedTuple
+from urllib.parse import urljoin, urlsplit
+
+from data.contact import get_contact_info
+from data.content import get_contents
+from data.mentorship import get_mentorship_info
+from data.projects import get_projects
+from data.recommendations import get_recommendations
+
+
+# Requisições simultâneas no total
+MAX_CONCURRENCY = 16
+
+# Conexões simultâneas por host
+MAX_CONNECTIONS_PER_HOST = 2
+
+# Intervalo mínimo (s) entre o início de duas requisições ao mesmo host
+HOST_MIN_INTERVAL = 0.5
+
+# Tempo limite (s) de cada requisição
+REQUEST_TIMEOUT = 10.0
+
+# Quantidade máxima de redirecionamentos seguidos por link
+MAX_REDIRECTS = 5
+
+# Status de HEAD que levam a repetir a requisição com GET (servidores que recusam HEAD)
+HEAD_FALLBACK_STATUSES = {403, 405, 501}
+
+# Status de redirecionamento seguidos pelo verificador
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Erros de uma conexão keep-alive ociosa já fechada pelo servidor (a requisição é repetida)
+STALE_CONNECTION_ERRORS = (ConnectionResetError, BrokenPipeError, http.client.BadStatusLine)
+
+# Arquivo padrão do cache de validadores (ETag/Last-Modified)
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "links.json")
+
+USER_AGENT = "Mozilla/5.0 (compatible; portfolio-link-checker/1.0)"
+
+
+class LinkResult(NamedTuple):
+    """Resultado da verificação de um link."""
+
+    url: str
+    status: int | None
+    final_url: str
+    error: str
+    elapsed_ms: float
+    not_modified: bool
+
+    @property
+    def ok(self) -> bool:
+        """Indica se o link respondeu com sucesso."""
+        return self.status is not None and self.status < 400
+
+
+def collect_links() -> dict[str, list[str]]:
+    """
+    Reúne as URLs externas do portfólio e onde cada uma aparece.
+
+    Returns:
+        dict: URL -> origens (ex: ["recommendations[0]", "contact.github"])
+    """
+    links: dict[str, list[str]] = {}
+
+    def add(url: str, source: str) -> None:
+        if url and urlsplit(url).scheme in ("http", "https"):
+            links.setdefault(url, []).append(source)
+
+    for collection, records in (
+        ("projects", get_projects()),
+        ("contents", get_contents()),
+        ("recommendations", get_recommendations())
+    ):
+        for index, record in enumerate(records):
+            add(record.get("url", ""), f"{collection}[{index}]")
+    add(get_mentorship_info().get("contact_url", ""), "mentorship.contact_url")
+    for name, url in get_contact_info().items():
+        add(url, f"contact.{name}")
+    return links
+
+
+class HostPool:
+    """
+    Conexões reaproveitáveis e limite de taxa de um host.
+    """
+
+    def __init__(self, scheme: str, netloc: str, max_connections: int, min_interval: float,
+                 timeout: float) -> None:
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self._idle: list[http.client.HTTPConnection] = []
+        self._next_slot = 0.0
+        self._slot_lock = asyncio.Lock()
+
+    async def wait_turn(self) -> None:
+        """Aguarda o intervalo mínimo desde a última requisição ao host."""
+        async with self._slot_lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def connect(self) -> http.client.HTTPConnection:
+        """Abre uma nova conexão com o host."""
+        connection_type = (
+            http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        )
+        return connection_type(self.netloc, timeout=self.timeout)
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """
+        Retorna uma conexão ociosa do pool ou abre uma nova.
+
+        Returns:
+            tuple: (conexão, se foi reaproveitada do pool)
+        """
+        if self._idle:
+            return self._idle.pop(), True
+        return self.connect(), False
+
+    def release(self, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        """Devolve a conexão ao pool ou a fecha se não puder ser reaproveitada."""
+        if reusable:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    def close(self) -> None:
+        """Fecha todas as conexões ociosas."""
+        while self._idle:
+            self._idle.pop().close()
+
+
+def _send(connection: http.client.HTTPConnection, method: str, target: str,
+          headers: dict[str, str]) -> tuple[int, dict[str, str], bool]:
+    """
+    Envia uma requisição em uma conexão (executado fora do loop de eventos).
+
+    Returns:
+        tuple: (status, cabeçalhos em minúsculas, conexão reaproveitável)
+    """
+    connection.request(method, target, headers=headers)
+    response = connection.getresponse()
+    if method == "HEAD":
+        response.read()
+        reusable = not response.will_close
+    else:
+        # O corpo de um GET não é necessário: a conexão é descartada
+        reusable = False
+    response_headers = {name.lower(): value for name, value in response.getheaders()}
+    response.close()
+    return response.status, response_headers, reusable
+
+
+class LinkChecker:
+    """
+    Verificador concorrente de links com pool de conexões e cache de validadores.
+    """
+
+    def __init__(
+        self,
+        cache: dict | None = None,
+        concurrency: int = MAX_CONCURRENCY,
+        connections_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        host_interval: float = HOST_MIN_INTERVAL,
+        timeout: float = REQUEST_TIMEOUT
+    ) -> None:
+        self.cache = {} if cache is None else cache
+        self.concurrency = concurrency
+        self.connections_per_host = connections_per_host
+        self.host_interval = host_interval
+        self.timeout = timeout
+        self._pools: dict[tuple[str, str], HostPool] = {}
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _pool(self, scheme: str, netloc: str) -> HostPool:
+        """Retorna o pool do host, criando-o no primeiro uso."""
+        key = (scheme, netloc)
+        if key not in self._pools:
+            self._pools[key] = HostPool(
+                scheme, netloc, self.connections_per_host, self.host_interval, self.timeout
+            )
+        return self._pools[key]
+
+    async def _request(self, method: str, url: str) -> tuple[int, dict[str, str]]:
+        """
+        Executa uma requisição respeitando os limites globais e do host.
+
+        Envia If-None-Match/If-Modified-Since quando há validadores em cache para a URL.
+        Se uma conexão reaproveitada do pool já foi fechada pelo servidor, a
+        requisição é repetida uma vez em uma conexão nova.
+        """
+        parts = urlsplit(url)
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+
+        headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+        cached = self.cache.get(url, {})
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        pool = self._pool(parts.scheme, parts.netloc)
+        async with self._semaphore, pool.semaphore:
+            await pool.wait_turn()
+            connection, reused = pool.acquire()
+            try:
+                try:
+                    status, response_headers, reusable = await asyncio.to_thread(
+                        _send, connection, method, target, headers
+                    )
+                except STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    connection.close()
+                    connection = pool.connect()
+                    status, response_headers, reusable = await asyncio.to_thread(
+                        _send, connection, method, target, headers
+                    )
+            except BaseException:
+                pool.release(connection, reusable=False)
+                raise
+            pool.release(connection, reusable)
+        return status, response_headers
+
+    async def check(self, url: str) -> LinkResult:
+        """
+        Verifica um link, seguindo redirecionamentos.
+
+        Args:
+            url: URL a verificar
+
+        Returns:
+            LinkResult: Status final, URL final e se a resposta veio do cache (304)
+        """
+        start = time.perf_counter()
+        current = url
+        not_modified = False
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, headers = await self._request("HEAD", current)
+                if status in HEAD_FALLBACK_STATUSES:
+                    status, headers = await self._request("GET", current)
+
+                if status == 304 and current in self.cache:
+                    # Validadores ainda válidos: reaproveita a resposta anterior
+                    not_modified = True
+                    status = self.cache[current]["status"]
+                    headers = {"location": self.cache[current].get("location", "")}
+                else:
+                    self.cache[current] = {
+                        "status": status,
+                        "etag": headers.get("etag", ""),
+                        "last_modified": headers.get("last-modified", ""),
+                        "location": headers.get("location", "")
+                    }
+
+                if status in REDIRECT_STATUSES and headers.get("location"):
+                    current = urljoin(current, headers["location"])
+                    continue
+                return LinkResult(url, status, current, "", (time.perf_counter() - start) * 1000, not_modified)
+            error = f"mais de {MAX_REDIRECTS} redirecionamentos"
+        except (OSError, http.client.HTTPException) as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        return LinkResult(url, None, current, error, (time.perf_counter() - start) * 1000, not_modified)
+
+    async def run(self, urls: list[str]) -> list[LinkResult]:
+        """
+        Verifica todas as URLs concorrentemente.
+
+        Args:
+            urls: URLs a verificar
+
+        Returns:
+            list[LinkResult]: Resultados na mesma ordem das URLs
+        """
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            return await asyncio.gather(*(self.check(url) for url in urls))
+        finally:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+
+def load_cache(path: str) -> dict:
+    """Lê o cache de validadores, retornando um cache vazio se não existir ou estiver inválido."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path: str, cache: dict) -> None:
+    """Grava o cache de validadores."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(cache, file, indent=2, sort_keys=True)
+
+
+def build_report(links: dict[str, list[str]], results: list[LinkResult]) -> dict:
+    """
+    Monta o relatório da verificação.
+
+    Args:
+        links: URL -> origens, como retornado por collect_links
+        results: Resultados de LinkChecker.run
+
+    Returns:
+        dict: Totais e um item por link (status, URL final, erro, origens)
+    """
+    return {
+        "checked": len(results),
+        "broken": sum(not result.ok for result in results),
+        "not_modified": sum(result.not_modified for result in results),
+        "links": [
+            {**result._asdict(), "ok": result.ok, "sources": links.get(result.url, [])}
+            for result in results
+        ]
+    }
+
+
+def print_report(report: dict) -> None:
+    """Imprime o relatório em formato de tabela, com os links quebrados primeiro."""
+    print(f"{'status':<8}{'ms':>8}  {'url':<70}sources")
+    for link in sorted(report["links"], key=lambda item: item["ok"]):
+        status = str(link["status"]) if link["status"] is not None else "ERR"
+        if link["not_modified"]:
+            status += "*"
+        url = link["url"] if len(link["url"]) <= 68 else link["url"][:65] + "..."
+        print(f"{status:<8}{link['elapsed_ms']:>8.0f}  {url:<70}{', '.join(link['sources'])}")
+        if link["error"]:
+            print(f"{'':<18}{link['error']}")
+    print(f"{report['checked']} links, {report['broken']} broken, "
+          f"{report['not_modified']} not modified (*)")
+
+
+def main() -> int:
+    """Executa a verificação pela linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="Grava o relatório em JSON neste arquivo")
+    parser.add_argument("--cache", default=CACHE_FILE, help="Arquivo do cache de ETag/Last-Modified")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Requisições simultâneas")
+    parser.add_argument("--per-host", type=int, default=MAX_CONNECTIONS_PER_HOST,
+                        help="Conexões simultâneas por host")
+    parser.add_argument("--host-interval", type=float, default=HOST_MIN_INTERVAL,
+                        help="Intervalo mínimo (s) entre requisições ao mesmo host")
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT, help="Tempo limite por requisição (s)")
+    args = parser.parse_args()
+
+    links = collect_links()
+    cache = load_cache(args.cache)
+    checker = LinkChecker(cache, args.concurrency, args.per_host, args.host_interval, args.timeout)
+    results = asyncio.run(checker.run(list(links)))
+    save_cache(args.cache, cache)
+
+    report = build_report(links, results)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return 1 if report["broken"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,110 @@
 Componente de botões HTML customizados para o portfólio Streamlit.
 
 Este módulo fornece funções para criar botões estilizados que abrem URLs em novas abas.
+
+Por padrão os botões são emitidos como HTML inline via st.markdown, sem criar um
+iframe por botão. O modo "iframe" (components.html) continua disponível para
+comparação no benchmark de botões. BUTTON_RENDER_MODE e a etapa "buttons" da
+instrumentação valem para os botões avulsos de create_custom_button; os botões
+das listas são gerados por button_html dentro do bloco de cada página
+(components/listings.py).
 """
 
+import html
+
+import streamlit as st
 import streamlit.components.v1 as components
+from components.instrumentation import instrumented
 
 
-def create_custom_button(
+# Modo de renderização padrão dos botões: "inline" (st.markdown) ou "iframe" (components.html)
+BUTTON_RENDER_MODE = "inline"
+
+# Estilos compartilhados pelos botões inline, injetados uma vez por execução
+BUTTON_STYLES = """
+<style>
+a.portfolio-button {
+    display: inline-block;
+    padding: 0.75rem 1.5rem;
+    margin: 0.5rem 0.5rem 0.5rem 0;
+    text-decoration: none;
+    font-weight: 500;
+    text-align: center;
+    transition: opacity 0.3s ease;
+    cursor: pointer;
+}
+a.portfolio-button:hover {
+    opacity: 0.8;
+    text-decoration: none;
+}
+</style>
+"""
+
+
+def inject_button_styles() -> None:
+    """
+    Injeta o CSS compartilhado dos botões inline na página.
+    
+    Deve ser chamada uma vez por execução do script, antes de renderizar botões.
+    """
+    st.markdown(BUTTON_STYLES, unsafe_allow_html=True)
+
+
+def button_html(
     text: str,
     url: str,
     background_color: str = "#0066cc",
     text_color: str = "#ffffff",
     border_radius: str = "5px"
+) -> str:
+    """
+    Gera o HTML inline de um botão que abre URL em nova aba.
+    
+    Args:
+        text: Texto exibido no botão
+        url: URL de destino
+        background_color: Cor de fundo do botão (padrão: #0066cc)
+        text_color: Cor do texto (padrão: #ffffff)
+        border_radius: Raio da borda (padrão: 5px)
+    
+    Returns:
+        str: Elemento <a> estilizado com a classe portfolio-button
+    """
+    return (
+        f'<a class="portfolio-button" href="{html.escape(url)}" target="_blank" '
+        f'rel="noopener noreferrer" style="'
+        f'background-color: {background_color}; '
+        f'color: {text_color}; '
+        f'border-radius: {border_radius};">'
+        f'{html.escape(text)}</a>'
+    )
+
+
+def render_button_group(buttons: list[dict]) -> None:
+    """
+    Renderiza vários botões inline em um único bloco HTML.
+    
+    Args:
+        buttons: Lista de dicionários com os argumentos de button_html
+                 (text, url e opcionalmente background_color, text_color e border_radius)
+    """
+    if not buttons:
+        return
+    
+    st.markdown(
+        "".join(button_html(**button) for button in buttons),
+        unsafe_allow_html=True
+    )
+
+
+@instrumented("buttons")
+def create_custom_button(
+    text: str,
+    url: str,
+    background_color: str = "#0066cc",
+    text_color: str = "#ffffff",
+    border_radius: str = "5px",
+    mode: str | None = None
 ) -> None:
     """
     Cria um botão HTML customizado que abre URL em nova aba.
@@ -23,8 +116,20 @@ def create_custom_button(
         background_color: Cor de fundo do botão (padrão: #0066cc)
         text_color: Cor do texto (padrão: #ffffff)
         border_radius: Raio da borda (padrão: 5px)
+        mode: Modo de renderização ("inline" ou "iframe").
+              Se None, usa BUTTON_RENDER_MODE.
     """
-    button_html = f"""
+    if (mode or BUTTON_RENDER_MODE) == "inline":
+        render_button_group([{
+            "text": text,
+            "url": url,
+            "background_color": background_color,
+            "text_color": text_color,
+            "border_radius": border_radius
+        }])
+        return
+    
+    iframe_html = f"""
     <a href="{url}" target="_blank" style="
         display: inline-block;
         padding: 0.75rem 1.5rem;
@@ -41,4 +146,4 @@ def create_custom_button(
     </a>
     """
     
-    components.html(button_html, height=60)
+    components.html(iframe_html, height=60)
@@ -3,10 +3,29 @@ Componente de cards de projetos para o portfólio Streamlit.
 
 Este módulo fornece funções para renderizar cards de projetos e organizar
 múltiplos projetos em um layout de grid.
+
+Por padrão o grid é emitido como um único bloco HTML com CSS grid, de modo que
+a quantidade de elementos enviados ao navegador não cresce com o número de
+projetos. O modo "columns" (st.columns + elementos por card) continua disponível.
 """
 
+import html
+
 import streamlit as st
-from data.translations import get_translation
+from components.instrumentation import instrumented
+from components.render_cache import cached_html
+from data.records import Project
+from data.translations import get_catalog
+
+
+# Modo de renderização padrão do grid: "html" (bloco único) ou "columns" (st.columns)
+PROJECTS_GRID_MODE = "html"
+
+# Quantidade padrão de colunas do grid
+GRID_COLUMNS = 2
+
+# Breakpoints responsivos padrão: largura máxima da tela (px) -> colunas
+GRID_BREAKPOINTS = {768: 1}
 
 
 def render_project_card(
@@ -26,18 +45,20 @@ def render_project_card(
         url: Link para o projeto
         language: Idioma atual para tradução de labels
     """
+    catalog = get_catalog(language)
+    
     with st.container():
         st.markdown(f"### {title}")
         st.write(description)
         
         # Exibir tecnologias
         if technologies:
-            tech_label = get_translation("projects_technologies", language)
+            tech_label = catalog.projects_technologies
             tech_badges = " • ".join([f"`{tech}`" for tech in technologies])
             st.markdown(f"**{tech_label}:** {tech_badges}")
         
         # Botão para ver projeto
-        view_text = get_translation("projects_view", language)
+        view_text = catalog.projects_view
         st.markdown(
             f'<a href="{url}" target="_blank" style="'
             'display: inline-block; '
@@ -55,17 +76,103 @@ def render_project_card(
         st.markdown("---")
 
 
-def render_projects_grid(projects: list[dict], language: str) -> None:
+def project_grid_html(
+    projects: list[Project],
+    language: str,
+    columns: int = GRID_COLUMNS,
+    breakpoints: dict[int, int] | None = None
+) -> str:
+    """
+    Gera o HTML de todos os cards de projetos em um único grid CSS.
+    
+    Args:
+        projects: Registros de projeto (data/records.py)
+        language: Idioma atual
+        columns: Quantidade de colunas em telas largas
+        breakpoints: Largura máxima da tela (px) -> colunas. Se None, usa GRID_BREAKPOINTS.
+    
+    Returns:
+        str: Bloco HTML com estilos e cards
+    """
+    catalog = get_catalog(language)
+    breakpoints = GRID_BREAKPOINTS if breakpoints is None else breakpoints
+    
+    media_queries = "".join(
+        f"@media (max-width: {width}px) {{ .project-grid {{ grid-template-columns: repeat({count}, 1fr); }} }}"
+        for width, count in sorted(breakpoints.items(), reverse=True)
+    )
+    styles = (
+        "<style>"
+        f".project-grid {{ display: grid; grid-template-columns: repeat({columns}, 1fr); gap: 2rem; }}"
+        ".project-card { border-bottom: 1px solid rgba(49, 51, 63, 0.2); padding-bottom: 1rem; }"
+        ".project-card a.project-link { display: inline-block; padding: 0.5rem 1rem; "
+        "background-color: #0066cc; color: white; text-decoration: none; border-radius: 5px; "
+        "margin-top: 0.5rem; font-weight: 500; }"
+        f"{media_queries}"
+        "</style>"
+    )
+    
+    cards = []
+    for project in projects:
+        technologies = project.technologies
+        tech_line = (
+            f"<p><strong>{html.escape(catalog.projects_technologies)}:</strong> "
+            + " • ".join(f"<code>{html.escape(tech)}</code>" for tech in technologies)
+            + "</p>"
+            if technologies else ""
+        )
+        cards.append(
+            '<div class="project-card">'
+            f'<h3>{html.escape(project.text("title", language))}</h3>'
+            f'<p>{html.escape(project.text("description", language))}</p>'
+            f"{tech_line}"
+            f'<a class="project-link" href="{html.escape(project.url)}" target="_blank" '
+            f'rel="noopener noreferrer">{html.escape(catalog.projects_view)}</a>'
+            "</div>"
+        )
+    
+    return f'{styles}<div class="project-grid">{"".join(cards)}</div>'
+
+
+@instrumented("cards")
+def render_projects_grid(
+    projects: list[Project],
+    language: str,
+    columns: int = GRID_COLUMNS,
+    breakpoints: dict[int, int] | None = None,
+    mode: str | None = None,
+    cache_key: tuple | None = None
+) -> None:
     """
     Renderiza múltiplos projetos em layout de grid responsivo.
     
     Args:
-        projects: Lista de dicionários com dados dos projetos
+        projects: Registros de projeto (data/records.py)
         language: Idioma atual
+        columns: Quantidade de colunas em telas largas (modo "html")
+        breakpoints: Largura máxima da tela (px) -> colunas (modo "html")
+        mode: Modo de renderização ("html" ou "columns").
+              Se None, usa PROJECTS_GRID_MODE.
+        cache_key: Chave do HTML no cache de HTML renderizado (modo "html").
+                   Deve identificar a lista de projetos; se None, o HTML é sempre remontado.
     """
     if not projects:
-        empty_message = get_translation("projects_empty", language)
-        st.info(empty_message)
+        st.info(get_catalog(language).projects_empty)
+        return
+    
+    if (mode or PROJECTS_GRID_MODE) == "html":
+        # Mesma normalização de project_grid_html: só None usa o padrão, e
+        # um dict vazio gera uma chave própria
+        breakpoints = GRID_BREAKPOINTS if breakpoints is None else breakpoints
+        
+        def build() -> str:
+            return project_grid_html(projects, language, columns, breakpoints)
+        
+        grid_html = build() if cache_key is None else cached_html(
+            (*cache_key, language, columns, tuple(sorted(breakpoints.items()))),
+            build
+        )
+        st.markdown(grid_html, unsafe_allow_html=True)
         return
     
     # Renderizar projetos em colunas responsivas (2 por linha)
@@ -76,14 +183,12 @@ def render_projects_grid(projects: list[dict], language: str) -> None:
         # Primeiro projeto da linha
         with cols[0]:
             project = projects[i]
-            title = project["title"].get(language, project["title"].get("pt", ""))
-            description = project["description"].get(language, project["description"].get("pt", ""))
             
             render_project_card(
-                title=title,
-                description=description,
-                technologies=project.get("technologies", []),
-                url=project.get("url", "#"),
+                title=project.text("title", language),
+                description=project.text("description", language),
+                technologies=project.technologies,
+                url=project.url,
                 language=language
             )
         
@@ -91,14 +196,12 @@ def render_projects_grid(projects: list[dict], language: str) -> None:
         if i + 1 < len(projects):
             with cols[1]:
                 project = projects[i + 1]
-                title = project["title"].get(language, project["title"].get("pt", ""))
-                description = project["description"].get(language, project["description"].get("pt", ""))
                 
                 render_project_card(
-                    title=title,
-                    description=description,
-                    technologies=project.get("technologies", []),
-                    url=project.get("url", "#"),
+                    title=project.text("title", language),
+                    description=project.text("description", language),
+                    technologies=project.technologies,
+                    url=project.url,
                     language=language
                 )
         else:
@@ -0,0 +1,308 @@
+"""
+Componente de imagens otimizadas para o portfólio Streamlit.
+
+Este módulo gera variantes redimensionadas (AVIF, WebP e JPEG) das imagens
+em assets/ uma única vez e renderiza a menor variante que atende à largura de
+exibição, evitando reler e reprocessar o arquivo original a cada rerun. O HTML
+emitido passa pelo cache de HTML renderizado (components/render_cache.py).
+Com vários workers (PORTFOLIO_SHARED_CACHE_DIR), variantes e HTML ficam apenas
+no cache compartilhado e são lidos sob demanda, sem cópia nos caches de cada
+processo.
+
+No modo de assets estáticos (components/static_assets.py) as variantes são
+publicadas com o hash do conteúdo no nome e referenciadas por URL em um
+elemento <picture>, para que o navegador as guarde entre sessões; caso
+contrário, a menor variante JPEG é embutida como data URI (um <img> sem
+alternativas precisa de um formato suportado por todos os navegadores).
+"""
+
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+from typing import NamedTuple
+
+import streamlit as st
+from components.render_cache import cached_html
+from components.static_assets import is_static_mode, publish_asset
+from data.shared_cache import get_shared_cache
+
+
+# Densidades de pixel geradas para cada largura de exibição (1x e telas retina 2x)
+IMAGE_DENSITIES = (1, 2)
+
+# Formatos gerados em ordem de preferência, com parâmetros de codificação
+IMAGE_FORMATS = {
+    "AVIF": {"quality": 50},
+    "WEBP": {"quality": 80, "method": 6},
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+}
+
+# Formatos que podem ser embutidos em um <img> sem alternativas (suportados por todos os navegadores)
+INLINE_MIMETYPES = ("image/jpeg",)
+
+
+class ImageVariant(NamedTuple):
+    """Variante pré-codificada de uma imagem."""
+
+    mimetype: str
+    width: int
+    data: bytes
+    digest: str
+
+
+def _encode(image, image_format: str) -> bytes | None:
+    """
+    Codifica uma imagem PIL no formato especificado.
+
+    Args:
+        image: Imagem PIL já redimensionada
+        image_format: Formato de saída ('AVIF', 'WEBP' ou 'JPEG')
+
+    Returns:
+        bytes | None: Bytes codificados ou None se o Pillow não suportar o formato
+    """
+    buffer = io.BytesIO()
+    try:
+        image.save(buffer, format=image_format, **IMAGE_FORMATS[image_format])
+    except (KeyError, OSError, ValueError):
+        return None
+    return buffer.getvalue()
+
+
+def build_image_variants(path: str, width: int) -> list[ImageVariant]:
+    """
+    Gera as variantes redimensionadas de uma imagem para a largura informada.
+
+    Args:
+        path: Caminho da imagem original
+        width: Largura de exibição em pixels CSS
+
+    Returns:
+        list[ImageVariant]: Variantes geradas para cada densidade e formato suportado,
+                            identificadas pelo hash do conteúdo
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as original:
+        original = ImageOps.exif_transpose(original).convert("RGB")
+        variants = []
+        for density in IMAGE_DENSITIES:
+            target_width = min(width * density, original.width)
+            target_height = round(original.height * target_width / original.width)
+            resized = original.resize((target_width, target_height), Image.LANCZOS)
+            for image_format in IMAGE_FORMATS:
+                data = _encode(resized, image_format)
+                if data is None:
+                    continue
+                variants.append(ImageVariant(
+                    mimetype=f"image/{image_format.lower()}",
+                    width=target_width,
+                    data=data,
+                    digest=hashlib.sha256(data).hexdigest()[:16]
+                ))
+    return variants
+
+
+@st.cache_resource(show_spinner=False)
+def _process_image_variants(path: str, width: int, mtime: float) -> list[ImageVariant]:
+    """Retorna as variantes da imagem a partir do cache do processo (sem workers)."""
+    return build_image_variants(path, width)
+
+
+def get_image_variants(path: str, width: int, mtime: float) -> list[ImageVariant]:
+    """
+    Retorna as variantes da imagem, codificadas uma única vez.
+
+    O parâmetro mtime faz parte da chave do cache para que uma nova foto
+    substituída em assets/ seja reprocessada automaticamente. Se houver cache
+    compartilhado entre workers, as variantes são lidas dele a cada chamada e
+    não ficam retidas no processo: a chamada só acontece quando o HTML da
+    imagem ainda não está no cache de HTML renderizado.
+
+    Args:
+        path: Caminho da imagem original
+        width: Largura de exibição em pixels CSS
+        mtime: Data de modificação do arquivo
+
+    Returns:
+        list[ImageVariant]: Variantes geradas por build_image_variants
+    """
+    shared_cache = get_shared_cache()
+    if shared_cache is None:
+        return _process_image_variants(path, width, mtime)
+
+    # Com vários workers, apenas o primeiro codifica as variantes
+    payload = shared_cache.get_or_create(
+        f"image-variants:{os.path.abspath(path)}:{width}:{mtime}",
+        lambda: _serialize_variants(build_image_variants(path, width))
+    )
+    return _deserialize_variants(payload)
+
+
+def _serialize_variants(variants: list[ImageVariant]) -> bytes:
+    """Serializa variantes em JSON para o cache compartilhado."""
+    return json.dumps([
+        {**variant._asdict(), "data": base64.b64encode(variant.data).decode("ascii")}
+        for variant in variants
+    ]).encode("utf-8")
+
+
+def _deserialize_variants(payload: bytes) -> list[ImageVariant]:
+    """Reconstrói as variantes serializadas por _serialize_variants."""
+    return [
+        ImageVariant(**{**item, "data": base64.b64decode(item["data"])})
+        for item in json.loads(payload)
+    ]
+
+
+def select_image_variant(
+    variants: list[ImageVariant],
+    width: int,
+    mimetypes: tuple[str, ...] = INLINE_MIMETYPES
+) -> ImageVariant | None:
+    """
+    Seleciona a menor variante que cobre a largura de exibição em telas retina.
+
+    Args:
+        variants: Variantes disponíveis
+        width: Largura de exibição em pixels CSS
+        mimetypes: Formatos aceitos (padrão: os suportados por todos os navegadores)
+
+    Returns:
+        ImageVariant | None: Variante com menos bytes entre as de maior resolução útil
+    """
+    variants = [v for v in variants if v.mimetype in mimetypes]
+    if not variants:
+        return None
+    target_width = min(width * max(IMAGE_DENSITIES), max(v.width for v in variants))
+    candidates = [v for v in variants if v.width >= target_width]
+    return min(candidates, key=lambda v: len(v.data))
+
+
+@st.cache_resource(show_spinner=False)
+def get_image_urls(path: str, width: int, mtime: float) -> dict[str, str]:
+    """
+    Publica as variantes da imagem como assets estáticos versionados.
+
+    Args:
+        path: Caminho da imagem original
+        width: Largura de exibição em pixels CSS
+        mtime: Data de modificação do arquivo
+
+    Returns:
+        dict[str, str]: Hash da variante -> URL pública
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return {
+        variant.digest: publish_asset(
+            f"{stem}-{variant.width}w", variant.digest, variant.mimetype.split("/")[1], variant.data
+        )
+        for variant in get_image_variants(path, width, mtime)
+    }
+
+
+def picture_html(variants: list[ImageVariant], urls: dict[str, str], width: int, alt: str) -> str:
+    """
+    Gera um elemento <picture> com uma fonte por formato e densidades 1x/2x.
+
+    Args:
+        variants: Variantes da imagem
+        urls: Hash da variante -> URL pública
+        width: Largura de exibição em pixels CSS
+        alt: Texto alternativo da imagem
+
+    Returns:
+        str: HTML do <picture>, com o último formato (JPEG) como <img> padrão
+    """
+    by_format: dict[str, list[ImageVariant]] = {}
+    for variant in variants:
+        by_format.setdefault(variant.mimetype, []).append(variant)
+
+    sources = []
+    for mimetype, format_variants in by_format.items():
+        srcset = ", ".join(
+            f"{urls[variant.digest]} {variant.width / width:g}x"
+            for variant in sorted(format_variants, key=lambda v: v.width)
+        )
+        sources.append((mimetype, srcset, urls[min(format_variants, key=lambda v: v.width).digest]))
+
+    fallback_mimetype, fallback_srcset, fallback_src = sources[-1]
+    return (
+        "<picture>"
+        + "".join(f'<source type="{mimetype}" srcset="{srcset}">' for mimetype, srcset, _ in sources[:-1])
+        + f'<img src="{fallback_src}" srcset="{fallback_srcset}" width="{width}" '
+        f'alt="{html.escape(alt)}" style="max-width: 100%; height: auto;">'
+        "</picture>"
+    )
+
+
+def image_html(path: str, width: int, mtime: float, alt: str, static_mode: bool) -> str:
+    """
+    Gera o HTML da menor variante pré-codificada de uma imagem local.
+
+    Args:
+        path: Caminho da imagem original
+        width: Largura de exibição em pixels CSS
+        mtime: Data de modificação do arquivo
+        alt: Texto alternativo da imagem
+        static_mode: Se as variantes são publicadas como assets estáticos
+
+    Returns:
+        str: <picture> com URLs versionadas, <img> com data URI ou "" se não
+             houver variante utilizável
+    """
+    variants = get_image_variants(path, width, mtime)
+    if not variants:
+        return ""
+
+    if static_mode:
+        return picture_html(variants, get_image_urls(path, width, mtime), width, alt)
+
+    variant = select_image_variant(variants, width)
+    if variant is None:
+        return ""
+
+    encoded = base64.b64encode(variant.data).decode("ascii")
+    return (
+        f'<img src="data:{variant.mimetype};base64,{encoded}" '
+        f'width="{width}" alt="{html.escape(alt)}" style="max-width: 100%; height: auto;">'
+    )
+
+
+def render_responsive_image(path: str, width: int, alt: str = "") -> bool:
+    """
+    Renderiza a menor variante pré-codificada de uma imagem local.
+
+    A imagem é emitida em um único elemento HTML, sem passar pelo
+    reprocessamento do st.image a cada rerun: no modo de assets estáticos, um
+    <picture> com URLs versionadas que o navegador guarda entre sessões; nos
+    demais casos, a menor variante JPEG embutida como data URI. Mensagens a
+    partir de global.minCachedMessageSize (10 KB) ficam no cache de mensagens
+    do navegador, então reruns seguintes enviam apenas a referência da imagem.
+
+    Args:
+        path: Caminho da imagem original
+        width: Largura de exibição em pixels CSS
+        alt: Texto alternativo da imagem
+
+    Returns:
+        bool: True se a imagem foi renderizada, False se o arquivo não existir
+    """
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return False
+
+    static_mode = is_static_mode()
+    content = cached_html(
+        ("image", os.path.abspath(path), width, mtime, alt, static_mode),
+        lambda: image_html(path, width, mtime, alt, static_mode)
+    )
+    if not content:
+        return False
+
+    st.markdown(content, unsafe_allow_html=True)
+    return True
@@ -0,0 +1,322 @@
+"""
+Instrumentação de renderização do portfólio Streamlit.
+
+Este módulo mede cada etapa do caminho de rerun (main, sidebar, conteúdo,
+seções e componentes): tempo de execução, quantidade de elementos enviados ao
+navegador e bytes das mensagens (deltas) emitidas, além da memória ocupada pelo
+estado de cada sessão. Os bytes também são medidos após compressão deflate com
+contexto compartilhado entre mensagens, como no permessage-deflate do
+WebSocket (server.enableWebsocketCompression).
+
+A instrumentação é ativada com ?debug=1 na URL (painel de depuração no
+sidebar) ou com a variável de ambiente PORTFOLIO_PROFILING=1. As métricas
+agregadas do processo ficam disponíveis em formato texto do Prometheus via
+render_metrics(), em um endpoint HTTP opcional (PORTFOLIO_METRICS_PORT) e no
+log "portfolio.instrumentation", com uma linha por execução. Reexecuções de
+fragmento (paginação, filtros) não passam por main() e são registradas como
+execuções próprias, abertas e fechadas pela etapa mais externa.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from components.render_cache import render_cache_stats
+from components.sessions import deep_sizeof, session_memory_stats
+
+
+# Chaves do session_state usadas pela instrumentação
+ENABLED_KEY = "_instrumentation_enabled"
+RUN_KEY = "_instrumentation_run"
+
+_LOGGER = logging.getLogger("portfolio.instrumentation")
+
+# Pilha de etapas ativas da thread do script
+_ACTIVE = threading.local()
+
+# Totais do processo por etapa: [chamadas, segundos, elementos, bytes, bytes com deflate]
+_TOTALS: dict[str, list[float]] = {}
+_SESSION_BYTES = [0, 0]  # [observações, soma dos bytes do session_state]
+_TOTALS_LOCK = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Indica se a instrumentação está ativa na execução atual."""
+    return get_script_run_ctx() is not None and st.session_state.get(ENABLED_KEY, False)
+
+
+def _is_fragment_run() -> bool:
+    """Indica se a execução atual reexecuta apenas fragmentos, sem passar por main()."""
+    return bool(getattr(get_script_run_ctx(), "fragment_ids_this_run", None))
+
+
+def _stack() -> list[dict]:
+    """Retorna a pilha de etapas ativas da thread atual."""
+    if not hasattr(_ACTIVE, "stack"):
+        _ACTIVE.stack = []
+    return _ACTIVE.stack
+
+
+def _install_counter() -> None:
+    """Envolve o envio de mensagens da sessão para contar elementos e bytes por etapa."""
+    ctx = get_script_run_ctx()
+    enqueue = getattr(ctx, "_enqueue", None)
+    if enqueue is None or getattr(enqueue, "_instrumented", False):
+        return
+
+    # Compressor com janela compartilhada entre mensagens (context takeover),
+    # como o permessage-deflate do WebSocket
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+
+    def counting_enqueue(msg):
+        if msg.HasField("delta"):
+            payload = msg.SerializeToString()
+            # O permessage-deflate remove o sufixo 00 00 ff ff de cada mensagem
+            deflated = len(compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH)) - 4
+            for stage in _stack():
+                stage["elements"] += 1
+                stage["bytes"] += len(payload)
+                stage["deflate_bytes"] += deflated
+        enqueue(msg)
+
+    counting_enqueue._instrumented = True
+    ctx._enqueue = counting_enqueue
+
+
+def start_run() -> None:
+    """
+    Inicia a instrumentação de uma execução completa do script.
+
+    Deve ser chamada no início de main(), depois de setup_page().
+    """
+    if ENABLED_KEY not in st.session_state:
+        st.session_state[ENABLED_KEY] = (
+            os.environ.get("PORTFOLIO_PROFILING") == "1"
+            or st.query_params.get("debug") == "1"
+        )
+    if st.session_state[ENABLED_KEY]:
+        _install_counter()
+        st.session_state[RUN_KEY] = {}
+
+
+@contextmanager
+def measure(stage: str):
+    """
+    Mede uma etapa do rerun: tempo, elementos e bytes emitidos.
+
+    Chamadas repetidas da mesma etapa em uma execução são somadas.
+
+    Args:
+        stage: Nome da etapa (ex: "sidebar", "section:content", "buttons")
+    """
+    if not is_enabled():
+        yield
+        return
+
+    record = {"elements": 0, "bytes": 0, "deflate_bytes": 0}
+    stack = _stack()
+    # Em uma reexecução de fragmento, a etapa mais externa abre a execução
+    fragment_run = not stack and _is_fragment_run()
+    if fragment_run:
+        _install_counter()
+        st.session_state[RUN_KEY] = {}
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        run = st.session_state.setdefault(RUN_KEY, {})
+        stats = run.setdefault(
+            stage, {"calls": 0, "ms": 0.0, "elements": 0, "bytes": 0, "deflate_bytes": 0}
+        )
+        stats["calls"] += 1
+        stats["ms"] += elapsed * 1000
+        stats["elements"] += record["elements"]
+        stats["bytes"] += record["bytes"]
+        stats["deflate_bytes"] += record["deflate_bytes"]
+        with _TOTALS_LOCK:
+            totals = _TOTALS.setdefault(stage, [0, 0.0, 0, 0, 0])
+            totals[0] += 1
+            totals[1] += elapsed
+            totals[2] += record["elements"]
+            totals[3] += record["bytes"]
+            totals[4] += record["deflate_bytes"]
+        if fragment_run:
+            finish_run()
+
+
+def instrumented(stage: str):
+    """
+    Decorador que mede todas as chamadas de uma função como uma etapa.
+
+    Args:
+        stage: Nome da etapa
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with measure(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def finish_run() -> None:
+    """
+    Finaliza a execução: registra a memória da sessão e grava a linha de log.
+
+    Deve ser chamada ao final de main(); em reexecuções de fragmento, é chamada
+    por measure() ao fim da etapa mais externa.
+    """
+    if not is_enabled():
+        return
+
+    session_bytes = deep_sizeof({key: st.session_state[key] for key in st.session_state})
+    with _TOTALS_LOCK:
+        _SESSION_BYTES[0] += 1
+        _SESSION_BYTES[1] += session_bytes
+    st.session_state[RUN_KEY]["_session"] = {"bytes": session_bytes}
+    _LOGGER.info(json.dumps({
+        "run": "fragment" if _is_fragment_run() else "full",
+        "stages": st.session_state[RUN_KEY]
+    }))
+
+
+def render_debug_panel() -> None:
+    """Renderiza no sidebar a tabela de etapas da última execução."""
+    if not is_enabled():
+        return
+
+    run = st.session_state.get(RUN_KEY, {})
+    rows = [
+        f"| {stage} | {stats['calls']} | {stats['ms']:.1f} | {stats['elements']} | {stats['bytes']} "
+        f"| {stats['deflate_bytes']} |"
+        for stage, stats in run.items()
+        if not stage.startswith("_")
+    ]
+    session_bytes = run.get("_session", {}).get("bytes", 0)
+    with st.sidebar.expander("Debug: render profile"):
+        st.markdown(
+            "| stage | calls | ms | elements | bytes | deflate |\n|---|---:|---:|---:|---:|---:|\n"
+            + "\n".join(rows)
+        )
+        st.caption(f"session_state: {session_bytes / 1024:.1f} KB")
+        cache = render_cache_stats()
+        st.caption(
+            f"render cache: {cache['hit_rate']:.0%} hits "
+            f"({cache['hits']}/{cache['hits'] + cache['misses']}), {cache['entries']} entries"
+        )
+        sessions = session_memory_stats()
+        st.caption(f"sessions: {sessions['live_sessions']} live ({sessions['live_bytes'] / 1024:.1f} KB)")
+
+
+def render_metrics() -> str:
+    """
+    Retorna as métricas agregadas do processo no formato texto do Prometheus.
+
+    Returns:
+        str: Métricas por etapa, memória das sessões ativas e uso do cache de HTML
+    """
+    metrics = (
+        ("portfolio_stage_calls_total", "counter", "Executions of each render stage", 0),
+        ("portfolio_stage_seconds_total", "counter", "Time spent in each render stage", 1),
+        ("portfolio_stage_elements_total", "counter", "Elements emitted by each render stage", 2),
+        ("portfolio_stage_bytes_total", "counter", "Delta bytes emitted by each render stage", 3),
+        ("portfolio_stage_deflate_bytes_total", "counter",
+         "Delta bytes after permessage-deflate style compression", 4),
+    )
+    with _TOTALS_LOCK:
+        totals = {stage: list(values) for stage, values in _TOTALS.items()}
+        observations, session_bytes = _SESSION_BYTES
+
+    lines = []
+    for name, metric_type, description, index in metrics:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for stage, values in sorted(totals.items()):
+            lines.append(f'{name}{{stage="{stage}"}} {values[index]:g}')
+    lines.append("# HELP portfolio_session_state_bytes Session state size observed at the end of each run")
+    lines.append("# TYPE portfolio_session_state_bytes summary")
+    lines.append(f"portfolio_session_state_bytes_sum {session_bytes}")
+    lines.append(f"portfolio_session_state_bytes_count {observations}")
+    
+    cache = render_cache_stats()
+    render_cache_metrics = (
+        ("portfolio_render_cache_hits_total", "counter", "Rendered HTML cache hits", "hits"),
+        ("portfolio_render_cache_misses_total", "counter", "Rendered HTML cache misses", "misses"),
+        ("portfolio_render_cache_evictions_total", "counter", "Entries evicted by the LRU policy", "evictions"),
+        ("portfolio_render_cache_invalidations_total", "counter", "Cache flushes after a data reload", "invalidations"),
+        ("portfolio_render_cache_entries", "gauge", "Entries currently cached", "entries"),
+        ("portfolio_render_cache_hit_ratio", "gauge", "Hits over lookups since process start", "hit_rate"),
+    )
+    for name, metric_type, description, field in render_cache_metrics:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.append(f"{name} {cache[field]:g}")
+    
+    sessions = session_memory_stats()
+    session_metrics = (
+        ("portfolio_sessions", "gauge", "Active sessions held by the process", "live_sessions"),
+        ("portfolio_session_memory_bytes", "gauge",
+         "Estimated session state memory of the active sessions", "live_bytes"),
+        ("portfolio_session_trimmed_keys_total", "counter",
+         "Keys removed by the session state size cap", "trimmed_keys"),
+    )
+    for name, metric_type, description, field in session_metrics:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        lines.append(f"{name} {sessions[field]}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Handler HTTP que responde /metrics com render_metrics()."""
+
+    def do_GET(self) -> None:
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = render_metrics().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def start_metrics_server() -> ThreadingHTTPServer | None:
+    """
+    Inicia, uma vez por processo, o endpoint /metrics na porta PORTFOLIO_METRICS_PORT.
+
+    As métricas são do processo: com vários workers, deploy/run_workers.py
+    atribui uma porta a cada worker.
+
+    Returns:
+        ThreadingHTTPServer | None: Servidor iniciado ou None se a porta não foi
+                                    configurada ou está em uso
+    """
+    port = os.environ.get("PORTFOLIO_METRICS_PORT")
+    if not port:
+        return None
+    try:
+        server = ThreadingHTTPServer(("127.0.0.1", int(port)), _MetricsHandler)
+    except OSError as error:
+        _LOGGER.warning("endpoint /metrics não iniciado na porta %s: %s", port, error)
+        return None
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
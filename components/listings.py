@@ -0,0 +1,210 @@
+"""
+Componente de listas de recomendações e conteúdos para o portfólio Streamlit.
+
+Cada página de uma lista é montada como um único bloco HTML (título,
+categoria, descrição e botão de cada item), pronto para ser guardado no cache
+de HTML renderizado (components/render_cache.py) e emitido com um único
+st.markdown por render_listing, medido na etapa "listings" da instrumentação.
+
+Os botões das listas fazem parte do bloco (button_html, classe
+portfolio-button de components/buttons.py) e são sempre inline: o modo
+"iframe" de BUTTON_RENDER_MODE vale apenas para os botões avulsos de
+create_custom_button. Descrições e justificativas aceitam o mesmo markdown
+inline que o st.markdown exibia (negrito, itálico, código e links).
+"""
+
+import html
+import re
+from typing import Callable
+
+import streamlit as st
+from components.buttons import button_html
+from components.instrumentation import instrumented
+from components.render_cache import cached_html
+from data.records import Content, Recommendation
+from data.translations import Catalog
+
+
+# Estilo das legendas (autor, data), equivalente ao st.caption
+CAPTION_STYLE = "color: rgba(49, 51, 63, 0.6); font-size: 0.875rem; margin-left: 1rem;"
+
+# Trechos de código inline (`código`), que não recebem as demais conversões
+_CODE_SPAN = re.compile(r"(`[^`\n]+`)")
+
+# Markdown inline convertido em HTML, aplicado a texto já escapado
+_MARKDOWN_INLINE = (
+    (re.compile(r"\*\*(.+?)\*\*"), r"<strong>\1</strong>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?![\w*])"), r"<em>\1</em>"),
+    (
+        re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)"),
+        r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>'
+    ),
+)
+
+
+def _text(value: str) -> str:
+    """Escapa texto para inclusão em HTML."""
+    return html.escape(value or "")
+
+
+def _inline_markdown(value: str) -> str:
+    """
+    Converte o markdown inline de um texto em HTML, escapando o restante.
+
+    Args:
+        value: Texto com negrito (**), itálico (*), código (`) e links [texto](http...)
+
+    Returns:
+        str: HTML seguro para inclusão no bloco da lista
+    """
+    parts = []
+    for part in _CODE_SPAN.split(_text(value)):
+        if part.startswith("`") and part.endswith("`") and len(part) > 1:
+            parts.append(f"<code>{part[1:-1]}</code>")
+            continue
+        for pattern, replacement in _MARKDOWN_INLINE:
+            part = pattern.sub(replacement, part)
+        parts.append(part)
+    return "".join(parts)
+
+
+def _paragraphs(value: str) -> str:
+    """Converte um texto em markdown em parágrafos HTML (separados por linha em branco)."""
+    return "".join(
+        f"<p>{_inline_markdown(paragraph.strip())}</p>"
+        for paragraph in re.split(r"\n\s*\n", value)
+        if paragraph.strip()
+    )
+
+
+def _caption(text: str) -> str:
+    """Gera uma legenda inline no estilo do st.caption."""
+    return f'<span style="{CAPTION_STYLE}">{_text(text)}</span>'
+
+
+def recommendation_list_html(
+    recommendations: list[Recommendation],
+    language: str,
+    catalog: Catalog,
+    category_labels: dict
+) -> str:
+    """
+    Gera o HTML de uma página de recomendações no idioma.
+
+    Args:
+        recommendations: Registros de recomendação da página (data/records.py)
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+        category_labels: Categoria -> rótulo traduzido
+
+    Returns:
+        str: Bloco HTML com todas as recomendações
+    """
+    items = []
+    for recommendation in recommendations:
+        category = recommendation.category
+        author_creator = recommendation.author_creator
+        url = recommendation.url
+        description = recommendation.text("description", language)
+        reason = recommendation.text("reason", language)
+        items.append(
+            f'<h3>{_text(recommendation.text("title", language))}</h3>'
+            f"<p><strong>{_text(category_labels.get(category, category))}</strong>"
+            + (_caption(f"{catalog.recommendations_by} {author_creator}") if author_creator else "")
+            + "</p>"
+            + _paragraphs(description)
+            + (
+                f"<p><strong>{_text(catalog.recommendations_why)}:</strong> {_inline_markdown(reason)}</p>"
+                if reason else ""
+            )
+            + (button_html(catalog.recommendations_access, url) if url else "")
+            + "<hr>"
+        )
+    return "".join(items)
+
+
+def period_label(period: str) -> str:
+    """Formata um período YYYY-MM como MM/YYYY (anos YYYY ficam inalterados)."""
+    return f"{period[5:7]}/{period[:4]}" if len(period) == 7 else period
+
+
+def content_list_html(
+    contents: list[Content],
+    language: str,
+    catalog: Catalog,
+    type_labels: dict
+) -> str:
+    """
+    Gera o HTML de uma página de conteúdos no idioma.
+
+    Args:
+        contents: Registros de conteúdo da página (data/records.py)
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+        type_labels: Tipo de conteúdo -> rótulo traduzido
+
+    Returns:
+        str: Bloco HTML com todos os conteúdos
+    """
+    items = []
+    for content in contents:
+        content_type = content.type
+        date = content.date
+        tags = content.tags
+        url = content.url
+        description = content.text("description", language)
+        items.append(
+            f'<h3>{_text(content.text("title", language))}</h3>'
+            f"<p><strong>{_text(type_labels.get(content_type, content_type))}</strong>"
+            + (_caption(f"📅 {date}") if date else "")
+            + "</p>"
+            + _paragraphs(description)
+            + (
+                f"<p>{_text(catalog.content_tags)}: "
+                + " • ".join(f"<code>{_text(tag)}</code>" for tag in tags)
+                + "</p>"
+                if tags else ""
+            )
+            + (button_html(catalog.content_view, url) if url else "")
+            + "<hr>"
+        )
+    return "".join(items)
+
+
+def content_timeline_html(
+    groups: list[tuple[str, list[Content]]],
+    language: str,
+    catalog: Catalog,
+    type_labels: dict
+) -> str:
+    """
+    Gera o HTML de conteúdos agrupados por período, com um título por período.
+    
+    Args:
+        groups: (período YYYY ou YYYY-MM, conteúdos), como em data.store.group_by_period
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+        type_labels: Tipo de conteúdo -> rótulo traduzido
+    
+    Returns:
+        str: Bloco HTML da linha do tempo
+    """
+    return "".join(
+        f"<h2>{_text(period_label(period))}</h2>" + content_list_html(contents, language, catalog, type_labels)
+        for period, contents in groups
+    )
+
+
+@instrumented("listings")
+def render_listing(cache_key: tuple, build: Callable[[], str]) -> None:
+    """
+    Emite o bloco HTML de uma página de lista com um único st.markdown.
+
+    O HTML é montado uma vez por chave (seção, idioma, filtro, página) e
+    compartilhado entre sessões pelo cache de HTML renderizado.
+
+    Args:
+        cache_key: Chave do bloco no cache de HTML renderizado
+        build: Função que monta o HTML da página (ex: content_list_html)
+    """
+    st.markdown(cached_html(cache_key, build), unsafe_allow_html=True)
@@ -0,0 +1,90 @@
+"""
+Componente de paginação para listas do portfólio Streamlit.
+
+Este módulo mantém a página atual de cada lista em st.session_state e
+renderiza controles de navegação, para que apenas a fatia visível de uma
+coleção seja construída a cada rerun.
+"""
+
+import streamlit as st
+from data.translations import Catalog
+
+
+# Quantidade padrão de itens exibidos por página
+PAGE_SIZE = 10
+
+
+def reset_page(state_key: str) -> None:
+    """
+    Volta a lista para a primeira página (ex: ao trocar o filtro).
+    
+    Args:
+        state_key: Chave do session_state que guarda a página atual
+    """
+    st.session_state[state_key] = 0
+
+
+def _change_page(state_key: str, step: int) -> None:
+    """Callback dos botões de navegação: avança ou retrocede uma página."""
+    st.session_state[state_key] = st.session_state.get(state_key, 0) + step
+
+
+def get_page_slice(state_key: str, total: int, page_size: int = PAGE_SIZE) -> slice:
+    """
+    Retorna a fatia de itens da página atual, ajustando páginas fora do intervalo.
+    
+    Args:
+        state_key: Chave do session_state que guarda a página atual
+        total: Quantidade total de itens da lista
+        page_size: Itens por página
+    
+    Returns:
+        slice: Fatia dos itens visíveis
+    """
+    page_count = max(1, -(-total // page_size))
+    page = min(max(st.session_state.get(state_key, 0), 0), page_count - 1)
+    st.session_state[state_key] = page
+    return slice(page * page_size, (page + 1) * page_size)
+
+
+def render_pagination(state_key: str, total: int, catalog: Catalog, page_size: int = PAGE_SIZE) -> None:
+    """
+    Renderiza os controles de página anterior/próxima e o indicador de página.
+    
+    Não renderiza nada se a lista couber em uma única página.
+    
+    Args:
+        state_key: Chave do session_state que guarda a página atual
+        total: Quantidade total de itens da lista
+        catalog: Catálogo de traduções compilado do idioma (o mesmo da seção)
+        page_size: Itens por página
+    """
+    page_count = -(-total // page_size)
+    if page_count <= 1:
+        return
+    
+    page = st.session_state.get(state_key, 0)
+    col_previous, col_info, col_next = st.columns([1, 2, 1])
+    
+    with col_previous:
+        st.button(
+            catalog.pagination_previous,
+            key=f"{state_key}_previous",
+            on_click=_change_page,
+            args=(state_key, -1),
+            disabled=page == 0
+        )
+    
+    with col_info:
+        st.caption(
+            catalog.pagination_page.format(page=page + 1, total=page_count)
+        )
+    
+    with col_next:
+        st.button(
+            catalog.pagination_next,
+            key=f"{state_key}_next",
+            on_click=_change_page,
+            args=(state_key, 1),
+            disabled=page >= page_count - 1
+        )
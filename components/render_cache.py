@@ -0,0 +1,186 @@
+"""
+Cache de HTML renderizado do portfólio Streamlit.
+
+O HTML das listas de cada seção é totalmente determinado pela seção, pelo
+idioma, pelo filtro selecionado (e pela página) e pelos dados em
+data/portfolio.jsonl. Este módulo guarda esse HTML já montado em um cache LRU
+limitado, compartilhado entre as sessões do processo: um rerun passa a custar
+uma consulta ao cache e a emissão de um único elemento.
+
+As entradas expiram após RENDER_CACHE_TTL segundos e o cache inteiro é
+descartado quando os dados são recarregados (data_version).
+
+Com vários workers (PORTFOLIO_SHARED_CACHE_DIR), o HTML fica apenas no cache
+compartilhado (data/shared_cache.py) e é lido sob demanda a cada uso, sem
+cópia no LRU do processo: a memória do HTML renderizado não cresce com a
+quantidade de workers. As entradas compartilhadas são identificadas pelo hash
+dos dados (data_digest) e do código que monta o HTML (CODE_VERSION), e não por
+contadores do processo, então um worker reiniciado após uma edição dos dados
+ou uma atualização do código nunca lê HTML antigo. As estatísticas de acerto
+são expostas em render_cache_stats() e nas métricas do Prometheus
+(components/instrumentation.py).
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from data.loader import data_digest, data_version
+from data.shared_cache import get_shared_cache
+
+
+# Quantidade máxima de entradas mantidas no cache do processo
+RENDER_CACHE_SIZE = 256
+
+# Tempo de vida (s) de cada entrada
+RENDER_CACHE_TTL = 600.0
+
+# Diretório raiz do projeto
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Pacotes cujo código determina o HTML renderizado (templates, seções, traduções)
+CODE_PACKAGES = ("components", "sections", "data")
+
+
+def _code_version() -> str:
+    """Retorna o hash do código-fonte de CODE_PACKAGES."""
+    hasher = hashlib.sha256()
+    for package in CODE_PACKAGES:
+        directory = os.path.join(ROOT, package)
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                with open(os.path.join(directory, name), "rb") as file:
+                    hasher.update(f"{package}/{name}\n".encode("utf-8") + file.read())
+    return hasher.hexdigest()[:16]
+
+
+# Versão do código que monta o HTML, calculada uma vez por processo
+CODE_VERSION = _code_version()
+
+
+class RenderCache:
+    """
+    Cache LRU de HTML com tempo de vida e invalidação por versão dos dados.
+    """
+
+    def __init__(self, max_entries: int = RENDER_CACHE_SIZE, ttl: float = RENDER_CACHE_TTL) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+        self._version: int | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_or_render(self, key: Hashable, builder: Callable[[], str]) -> str:
+        """
+        Retorna o HTML da chave, construindo-o apenas se não estiver em cache.
+
+        Args:
+            key: Chave do conteúdo, ex: ("recommendations", "pt", "book", 0)
+            builder: Função que monta o HTML
+
+        Returns:
+            str: HTML em cache ou recém-construído
+        """
+        shared_cache = get_shared_cache()
+        if shared_cache is not None:
+            return self._get_or_render_shared(shared_cache, key, builder)
+
+        version = data_version()
+        now = time.monotonic()
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        content = builder()
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (now, content)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return content
+
+    def _get_or_render_shared(self, shared_cache, key: Hashable, builder: Callable[[], str]) -> str:
+        """
+        Retorna o HTML da chave a partir do cache compartilhado entre workers.
+
+        Apenas o primeiro worker monta o HTML de cada chave, conteúdo dos dados
+        e versão do código; nenhum worker guarda cópia no LRU do processo.
+        """
+        shared_key = f"render:{data_digest()}:{CODE_VERSION}:{key!r}"
+        content = shared_cache.get_text(shared_key)
+        with self._lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if content is None:
+            content = builder()
+            shared_cache.set(shared_key, content.encode("utf-8"))
+        return content
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Retorna as estatísticas de uso do cache.
+
+        Returns:
+            dict: hits, misses, evictions, invalidations, entries e hit_rate (0 a 1)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+_RENDER_CACHE = RenderCache()
+
+
+def cached_html(key: Hashable, builder: Callable[[], str]) -> str:
+    """
+    Retorna o HTML da chave a partir do cache do processo.
+
+    Args:
+        key: Chave do conteúdo, ex: ("content", "en", "article", 0)
+        builder: Função que monta o HTML em caso de falta no cache
+
+    Returns:
+        str: HTML da chave
+
+    Examples:
+        >>> cached_html(("projects", "pt"), lambda: project_grid_html(get_projects(), "pt"))
+    """
+    return _RENDER_CACHE.get_or_render(key, builder)
+
+
+def render_cache_stats() -> dict:
+    """Retorna as estatísticas do cache de HTML do processo (ver RenderCache.stats)."""
+    return _RENDER_CACHE.stats()
@@ -0,0 +1,152 @@
+"""
+Gerenciamento da memória das sessões do portfólio Streamlit.
+
+Cada aba aberta mantém uma sessão no servidor com seu session_state. Este módulo:
+
+- limita o estado definido pelo app em cada sessão a SESSION_STATE_MAX_BYTES,
+  descartando as maiores chaves que não fazem parte do estado essencial
+  (PROTECTED_KEYS). As chaves dos widgets nunca são descartadas: o Streamlit
+  precisa delas para detectar mudanças e executar os callbacks on_change;
+- reporta a memória ocupada pelo session_state das sessões ativas
+  (session_memory_stats), exibida no painel de depuração e em /metrics.
+
+A liberação de sessões ociosas fica com o próprio Streamlit: quando a aba é
+fechada ou perde a conexão, a sessão inteira (estado, contexto de execução e
+mensagens em cache) é descartada após server.disconnectedSessionTTL segundos
+(.streamlit/config.toml). Uma sessão nova é reconstruída a partir da URL, que
+guarda o idioma e a seção (app.py).
+"""
+
+import logging
+import sys
+import threading
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+
+# Tamanho máximo estimado do estado definido pelo app em uma sessão
+SESSION_STATE_MAX_BYTES = 64 * 1024
+
+# Chaves essenciais, nunca descartadas pelo limite de tamanho
+PROTECTED_KEYS = frozenset({"language", "current_section"})
+
+_LOGGER = logging.getLogger("portfolio.sessions")
+
+# Tamanho do session_state de cada sessão, medido ao final da última execução completa
+_SESSION_BYTES: dict[str, int] = {}
+
+# Contadores do processo
+_COUNTERS = {"trimmed_keys": 0}
+
+_LOCK = threading.Lock()
+
+
+def deep_sizeof(value, seen: set | None = None) -> int:
+    """
+    Estima recursivamente a memória ocupada por um objeto e seu conteúdo.
+
+    Args:
+        value: Objeto a medir
+        seen: Identificadores já contabilizados (uso interno)
+
+    Returns:
+        int: Tamanho aproximado em bytes
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in value)
+    return size
+
+
+def _widget_keys(ctx):
+    """
+    Retorna as chaves dos widgets registrados na execução atual do script.
+
+    O contêiner suporta apenas consultas com `in`: nas versões recentes do
+    Streamlit é um conjunto thread-safe guardado em ctx.shared.
+    """
+    run_state = getattr(ctx, "shared", ctx)
+    return getattr(run_state, "widget_user_keys_this_run", frozenset())
+
+
+def enforce_state_cap(max_bytes: int = SESSION_STATE_MAX_BYTES) -> list[str]:
+    """
+    Limita o tamanho do estado definido pelo app na sessão atual.
+
+    Enquanto o estado excede o limite, a maior chave que não é de widget nem
+    de PROTECTED_KEYS é removida. Deve ser chamada ao final de main(), quando
+    todos os widgets da página já foram registrados. Também registra o tamanho
+    final do estado para session_memory_stats.
+
+    Args:
+        max_bytes: Tamanho máximo estimado do estado
+
+    Returns:
+        list[str]: Chaves removidas
+    """
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return []
+    widget_keys = _widget_keys(ctx)
+    sizes = {key: deep_sizeof(st.session_state[key]) for key in st.session_state}
+    total = sum(size for key, size in sizes.items() if key not in widget_keys)
+    dropped = []
+    for key in sorted(sizes, key=sizes.get, reverse=True):
+        if total <= max_bytes:
+            break
+        if key in widget_keys or key in PROTECTED_KEYS:
+            continue
+        del st.session_state[key]
+        total -= sizes.pop(key)
+        dropped.append(key)
+    with _LOCK:
+        _SESSION_BYTES[ctx.session_id] = sum(sizes.values())
+        _COUNTERS["trimmed_keys"] += len(dropped)
+    if dropped:
+        _LOGGER.warning("session_state acima de %d bytes: chaves removidas %s", max_bytes, dropped)
+    return dropped
+
+
+def _is_active(session_id: str) -> bool:
+    """Indica se a sessão ainda está conectada ao servidor Streamlit."""
+    if not Runtime.exists():
+        return False
+    try:
+        return Runtime.instance().is_active_session(session_id)
+    except AttributeError:
+        return True  # Runtime simulado (AppTest): a sessão de teste está sempre ativa
+
+
+def session_memory_stats() -> dict:
+    """
+    Retorna a memória ocupada pelo session_state das sessões ativas do processo.
+
+    Sessões que deixaram de estar ativas (aba fechada ou desconectada) deixam
+    de ser contadas; a memória delas é liberada pelo Streamlit após
+    server.disconnectedSessionTTL.
+
+    Returns:
+        dict: live_sessions, live_bytes e o contador trimmed_keys
+    """
+    with _LOCK:
+        sessions = dict(_SESSION_BYTES)
+        counters = dict(_COUNTERS)
+    inactive = [session_id for session_id in sessions if not _is_active(session_id)]
+    if inactive:
+        with _LOCK:
+            for session_id in inactive:
+                _SESSION_BYTES.pop(session_id, None)
+                del sessions[session_id]
+    return {
+        "live_sessions": len(sessions),
+        "live_bytes": sum(sessions.values()),
+        **counters,
+    }
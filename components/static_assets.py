@@ -0,0 +1,172 @@
+"""
+Publicação de assets estáticos com nomes versionados pelo conteúdo.
+
+Os assets gerados pelo app (variantes da foto de perfil) são gravados em
+static/ com o hash do conteúdo no nome (ex: profile-250w.3f9c2a1b4d5e6f70.webp).
+Como o nome muda sempre que o conteúdo muda, o navegador pode guardá-los
+indefinidamente (Cache-Control: immutable) e visitantes recorrentes não baixam
+nada de novo.
+
+Os arquivos são servidos de uma destas formas:
+- pelo próprio Streamlit em app/static/ (server.enableStaticServing). O
+  Streamlit envia apenas ETag, sem Cache-Control, e não permite configurar
+  esses cabeçalhos: o navegador revalida os arquivos a cada visita. O cache
+  immutable nesse modo exige o proxy de deploy/nginx.conf, que serve o
+  diretório diretamente com os cabeçalhos corretos;
+- por um servidor auxiliar na porta PORTFOLIO_ASSETS_PORT, com ETag, respostas
+  304 e Cache-Control immutable. Nesse caso PORTFOLIO_ASSETS_URL define a URL
+  pública usada nas páginas (ex: http://localhost:8600). O servidor escuta em
+  127.0.0.1; PORTFOLIO_ASSETS_HOST=0.0.0.0 o expõe em todas as interfaces.
+"""
+
+import mimetypes
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import streamlit as st
+
+
+# Diretório servido pelo Streamlit em app/static/ (ao lado de app.py)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+
+# Caminho, relativo à página do app, em que o Streamlit serve STATIC_DIR
+STATIC_URL_PATH = "app/static"
+
+# Variáveis de ambiente do servidor auxiliar de assets
+ASSETS_PORT_ENV = "PORTFOLIO_ASSETS_PORT"
+ASSETS_URL_ENV = "PORTFOLIO_ASSETS_URL"
+ASSETS_HOST_ENV = "PORTFOLIO_ASSETS_HOST"
+
+# Interface padrão do servidor auxiliar: só a máquina local, como o servidor de métricas
+DEFAULT_ASSETS_HOST = "127.0.0.1"
+
+# Cabeçalho de cache dos assets versionados
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Nome de arquivo versionado: <nome>.<hash de 16 caracteres>.<extensão>
+FINGERPRINTED_NAME = re.compile(r"^[\w-]+\.(?P<digest>[0-9a-f]{16})\.[a-z0-9]+$")
+
+
+def is_static_mode() -> bool:
+    """
+    Indica se os assets devem ser publicados como arquivos estáticos.
+
+    Returns:
+        bool: True se há servidor auxiliar configurado ou se o Streamlit serve static/
+    """
+    return bool(os.environ.get(ASSETS_URL_ENV)) or bool(st.get_option("server.enableStaticServing"))
+
+
+def asset_url(filename: str) -> str:
+    """
+    Retorna a URL pública de um asset publicado.
+
+    Args:
+        filename: Nome do arquivo em STATIC_DIR
+
+    Returns:
+        str: URL no servidor auxiliar (PORTFOLIO_ASSETS_URL) ou em app/static/
+    """
+    base_url = os.environ.get(ASSETS_URL_ENV)
+    if base_url:
+        return f"{base_url.rstrip('/')}/{filename}"
+    return f"{STATIC_URL_PATH}/{filename}"
+
+
+def publish_asset(name: str, digest: str, extension: str, data: bytes) -> str:
+    """
+    Grava um asset em STATIC_DIR com o hash do conteúdo no nome, se ainda não existir.
+
+    A escrita é atômica, então vários workers podem publicar o mesmo asset ao
+    mesmo tempo.
+
+    Args:
+        name: Nome base do asset (letras, números, '-' e '_')
+        digest: Hash do conteúdo com 16 caracteres hexadecimais
+        extension: Extensão do arquivo (sem ponto)
+        data: Conteúdo do asset
+
+    Returns:
+        str: URL pública do asset
+    """
+    filename = f"{name}.{digest}.{extension}"
+    path = os.path.join(STATIC_DIR, filename)
+    if not os.path.exists(path):
+        os.makedirs(STATIC_DIR, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=STATIC_DIR, prefix=".tmp-")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+    return asset_url(filename)
+
+
+class _AssetHandler(BaseHTTPRequestHandler):
+    """Handler HTTP que serve os assets versionados de STATIC_DIR com cache imutável."""
+
+    def _serve(self, include_body: bool) -> None:
+        filename = self.path.split("?", 1)[0].lstrip("/")
+        match = FINGERPRINTED_NAME.match(filename)
+        path = os.path.join(STATIC_DIR, filename)
+        if match is None or not os.path.isfile(path):
+            self.send_error(404)
+            return
+
+        # O hash no nome identifica o conteúdo: serve como ETag forte
+        etag = f'"{match.group("digest")}"'
+        if etag in self.headers.get("If-None-Match", ""):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+            self.end_headers()
+            return
+
+        with open(path, "rb") as file:
+            body = file.read()
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(filename)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        self._serve(include_body=True)
+
+    def do_HEAD(self) -> None:
+        self._serve(include_body=False)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def start_asset_server() -> ThreadingHTTPServer | None:
+    """
+    Inicia, uma vez por processo, o servidor de assets na porta PORTFOLIO_ASSETS_PORT.
+
+    Escuta em PORTFOLIO_ASSETS_HOST (padrão: DEFAULT_ASSETS_HOST).
+
+    Returns:
+        ThreadingHTTPServer | None: Servidor iniciado ou None se a porta não foi
+                                    configurada ou já é atendida por outro worker
+    """
+    port = os.environ.get(ASSETS_PORT_ENV)
+    if not port:
+        return None
+    try:
+        host = os.environ.get(ASSETS_HOST_ENV, DEFAULT_ASSETS_HOST)
+        server = ThreadingHTTPServer((host, int(port)), _AssetHandler)
+    except OSError:
+        return None  # com vários workers, a porta já está em uso pelo primeiro
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,17 @@
+"""
+Módulo de dados de contato do portfólio.
+
+Este módulo contém os links para redes sociais exibidos na seção Contato.
+"""
+
+from data.loader import load_record
+
+
+def get_contact_info():
+    """
+    Retorna os links de contato.
+    
+    Returns:
+        dict: Dicionário contendo as URLs de linkedin, github e medium.
+    """
+    return load_record("contact")
@@ -4,66 +4,94 @@ Módulo de dados de conteúdos publicados do portfólio.
 Este módulo contém links para artigos, vídeos e outros conteúdos criados.
 """
 
-CONTENTS = [
-    {
-        "title": {
-            "pt": "Ainda vale a pena aprender a programar na era do Vibe Code?",
-            "en": "Is It Still Worth Learning to Code in the Vibe Coding Era?"
-        },
-        "description": {
-            "pt": "Uma reflexão sobre porquê ainda vale a pena aprender a programar na era do Vibe Code",
-            "en": "A deep reflextion about you should learn to program in Vibe Coding Era"
-        },
-        "type": "article",
-        "url": "https://medium.com/@katielidieter/is-it-still-worth-learning-to-code-in-the-vibe-coding-era-6b3d29895340",
-        "date": "2025-12-30",
-        "tags": ["Python", "Programming", "Vibe Coding"]
-    },
-    {
-        "title": {
-            "pt": "O que eu faria se estivesse começando carreira em dados hoje",
-            "en": "What I would do if I were starting in data today"
-        },
-        "description": {
-            "pt": "Dicas práticas do que eu faria se estivesse começando na área de dados hoje",
-            "en": "Practical tips of what I would do if I were starting in data now. "
-        },
-        "type": "article",
-        "url": "https://medium.com/@katielidieter/o-que-eu-faria-se-estivesse-come%C3%A7ando-carreira-em-dados-hoje-1676c39359b4",
-        "date": "2024-09-11",
-        "tags": ["Data", "Career", "Mentor"]
-    },
-    {
-        "title": {
-            "pt": "[SCTEC] Despertar - O poder de decidir: O valor dos dados]",
-            "en": "[SCTEC] Wake - The power of decide: The value of data"
-        },
-        "description": {
-            "pt": "Apresentação sobre a àrea de dados e painel de discussão sobre oportunidades na insdustria.",
-            "en": "Talking about data industry and participating of a panel about it."
+from data.loader import load_collection, load_records
+from data.store import field_key, get_collection, month_key, year_key
+
+
+def __getattr__(name):
+    """Mantém CONTENTS acessível como atributo do módulo, lido de data/portfolio.jsonl."""
+    if name == "CONTENTS":
+        return load_collection("contents")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_collection():
+    """Retorna a coleção indexada de conteúdos (por tipo, tag, ano e mês), ordenada por data."""
+    return get_collection(
+        "contents",
+        load_records("contents"),
+        index_keys={
+            "type": field_key("type"),
+            "tag": field_key("tags"),
+            "year": year_key("date"),
+            "month": month_key("date")
         },
-        "type": "video",
-        "url": "https://www.youtube.com/live/FZgP06sjLa4",
-        "date": "2026-02-04",
-        "tags": ["Data", "Career", "Education"]
-    },
-]
+        date_field="date"
+    )
 
 
-def get_contents(content_type=None):
+def get_contents(content_type=None, tag=None, year=None):
     """
-    Retorna lista de conteúdos, opcionalmente filtrados por tipo.
+    Retorna lista de conteúdos, opcionalmente filtrados por tipo, tag ou ano.
     
     Args:
         content_type (str, optional): Tipo de conteúdo para filtrar 
                                      (article, video, podcast, tutorial).
                                      Se None, retorna todos os conteúdos.
+        tag (str, optional): Tag para filtrar.
+        year (str, optional): Ano de publicação (YYYY) para filtrar.
+    
+    Returns:
+        list[Content]: Lista de registros de conteúdo (data/records.py), dos mais
+                      recentes para os mais antigos, que
+                      funcionam como dicionários somente leitura.
+                      Cada conteúdo contém title, description, type, url, date e tags.
+    """
+    return _get_collection().filter(type=content_type, tag=tag, year=year)
+
+
+def get_contents_between(start=None, end=None, content_type=None):
+    """
+    Retorna conteúdos publicados em um intervalo de datas (busca binária).
+    
+    Args:
+        start (str, optional): Data inicial ISO, inclusiva (YYYY, YYYY-MM ou YYYY-MM-DD).
+        end (str, optional): Data final ISO, inclusiva (YYYY, YYYY-MM ou YYYY-MM-DD).
+        content_type (str, optional): Tipo de conteúdo para filtrar.
     
     Returns:
-        list[dict]: Lista de dicionários contendo conteúdos.
-                   Cada conteúdo contém title, description, type, url, date e tags.
+        list[Content]: Conteúdos do intervalo, dos mais recentes para os mais antigos.
+    
+    Examples:
+        >>> get_contents_between("2025", "2025")  # Conteúdos de 2025
+        >>> get_contents_between(start="2024-06")  # De junho de 2024 em diante
     """
-    if content_type is None:
-        return CONTENTS
+    return _get_collection().between(start, end, type=content_type)
+
+
+def get_latest_contents(limit=5, content_type=None):
+    """
+    Retorna os conteúdos mais recentes.
     
-    return [content for content in CONTENTS if content["type"] == content_type]
+    Args:
+        limit (int): Quantidade máxima de conteúdos.
+        content_type (str, optional): Tipo de conteúdo para filtrar.
+    
+    Returns:
+        list[Content]: Até limit conteúdos, dos mais recentes para os mais antigos.
+    """
+    return _get_collection().latest(limit, type=content_type)
+
+
+def get_content_periods(granularity="year"):
+    """
+    Retorna os anos (YYYY) ou meses (YYYY-MM) com conteúdos publicados.
+    
+    Args:
+        granularity (str): "year" ou "month"
+    
+    Returns:
+        list[str]: Períodos, dos mais recentes para os mais antigos.
+    """
+    return _get_collection().periods(granularity)
+
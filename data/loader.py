@@ -0,0 +1,243 @@
+"""
+Módulo de carregamento dos dados do portfólio a partir de arquivo.
+
+Os dados ficam em data/portfolio.jsonl, no formato JSON Lines: cada linha é
+um registro {"collection": <nome>, "data": {...}}. O arquivo é lido via mmap e
+verificado periodicamente; quando muda, apenas as coleções cujo conteúdo foi
+alterado são substituídas, sem reiniciar o servidor. Coleções inalteradas
+mantêm o mesmo objeto em memória, preservando índices e caches construídos
+sobre elas. Na leitura, as URLs de cada registro são canonicalizadas
+(data/urls.py), sem parâmetros de rastreamento, e o registro é validado e
+normalizado pelo esquema da coleção (data/schema.py): um arquivo inválido
+falha na primeira leitura; em uma recarga, o erro é registrado no log e os
+últimos dados válidos continuam sendo servidos até o arquivo ser corrigido.
+Projetos, conteúdos e recomendações são convertidos em registros tipados e
+compactos (data/records.py) já na leitura, sem manter os dicionários
+normalizados em memória; load_records e load_collection retornam os mesmos
+registros.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+
+from data.records import RECORD_TYPES, Record
+from data.schema import check_collections, normalize_record
+from data.urls import canonicalize_record
+
+
+# Arquivo de dados padrão do portfólio
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "portfolio.jsonl")
+
+# Intervalo mínimo (em segundos) entre verificações de alteração do arquivo
+RELOAD_INTERVAL = 2.0
+
+_LOGGER = logging.getLogger("portfolio.data")
+
+
+class DataFile:
+    """
+    Arquivo JSON Lines com as coleções do portfólio e recarga incremental.
+    """
+
+    def __init__(self, path: str, reload_interval: float = RELOAD_INTERVAL) -> None:
+        self.path = path
+        self.reload_interval = reload_interval
+        self.version = 0
+        self.digest = ""
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._checked_at = 0.0
+        self._collections: dict[str, list[dict] | tuple[Record, ...]] = {}
+        self._digests: dict[str, str] = {}
+
+    def _read(self) -> tuple[dict[str, list[dict] | tuple[Record, ...]], dict[str, str]]:
+        """
+        Lê o arquivo via mmap e agrupa os registros e seus hashes por coleção.
+
+        Coleções com tipo em RECORD_TYPES são convertidas em registros tipados
+        linha a linha; o dicionário normalizado de cada linha é descartado.
+        """
+        collections: dict[str, list] = {}
+        hashers = {}
+
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for line_number, line in enumerate(iter(mapped.readline, b""), start=1):
+                        if not line.strip():
+                            continue
+                        try:
+                            record = json.loads(line)
+                            name = record["collection"]
+                            data = normalize_record(name, canonicalize_record(record["data"]))
+                            if name in RECORD_TYPES:
+                                data = RECORD_TYPES[name].from_dict(data)
+                        except (ValueError, KeyError, TypeError, AttributeError) as error:
+                            raise ValueError(
+                                f"{self.path}:{line_number}: registro inválido ({error})"
+                            ) from error
+                        collections.setdefault(name, []).append(data)
+                        hashers.setdefault(name, hashlib.sha256()).update(line)
+
+        errors = check_collections({name: len(records) for name, records in collections.items()})
+        if errors:
+            raise ValueError(f"{self.path}: " + "; ".join(errors))
+        for name in collections.keys() & RECORD_TYPES.keys():
+            collections[name] = tuple(collections[name])
+        return collections, {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+    def refresh(self, force: bool = False) -> set[str]:
+        """
+        Recarrega o arquivo se ele mudou desde a última leitura.
+
+        Args:
+            force: Ignora o intervalo mínimo entre verificações
+
+        Returns:
+            set[str]: Nomes das coleções substituídas
+
+        Raises:
+            ValueError: Se o arquivo é inválido na primeira leitura
+            OSError: Se o arquivo não pode ser lido na primeira leitura
+        """
+        now = time.monotonic()
+        if not force and self._stamp is not None and now - self._checked_at < self.reload_interval:
+            return set()
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                stat = os.stat(self.path)
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                if stamp == self._stamp:
+                    return set()
+                collections, digests = self._read()
+            except (ValueError, OSError) as error:
+                if self._stamp is None:
+                    raise
+                # Edição inválida ou incompleta: mantém os últimos dados válidos
+                # e só tenta ler de novo quando o arquivo mudar outra vez
+                _LOGGER.error("recarga de %s ignorada, mantendo os dados anteriores: %s", self.path, error)
+                if isinstance(error, ValueError):
+                    self._stamp = stamp
+                return set()
+            changed = {
+                name for name in collections.keys() | self._collections.keys()
+                if digests.get(name) != self._digests.get(name)
+            }
+            for name in changed:
+                if name in collections:
+                    self._collections[name] = collections[name]
+                else:
+                    del self._collections[name]
+            self._digests = digests
+            self.digest = hashlib.sha256(
+                "".join(f"{name}:{digests[name]}\n" for name in sorted(digests)).encode("utf-8")
+            ).hexdigest()
+            self._stamp = stamp
+            if changed:
+                self.version += 1
+            return changed
+
+    def get(self, name: str) -> list[dict] | tuple[Record, ...]:
+        """
+        Retorna os registros atuais de uma coleção.
+
+        Args:
+            name: Nome da coleção (about, projects, mentorship, contents, recommendations)
+
+        Returns:
+            list[dict] | tuple[Record, ...]: Registros da coleção (tipados para as
+                                             coleções de RECORD_TYPES) ou lista vazia
+                                             se não existir
+        """
+        self.refresh()
+        return self._collections.get(name, [])
+
+    def records(self, name: str) -> tuple[Record, ...]:
+        """
+        Retorna os registros tipados de uma coleção.
+
+        Args:
+            name: Nome da coleção (projects, contents, recommendations)
+
+        Returns:
+            tuple[Record, ...]: Registros imutáveis da coleção
+
+        Raises:
+            KeyError: Se a coleção não possui tipo de registro
+        """
+        if name not in RECORD_TYPES:
+            raise KeyError(name)
+        self.refresh()
+        return self._collections.get(name, ())
+
+
+_DATA_FILE = DataFile(DATA_FILE)
+
+
+def load_collection(name: str) -> list[dict] | tuple[Record, ...]:
+    """
+    Retorna os registros de uma coleção do arquivo de dados padrão.
+
+    Args:
+        name: Nome da coleção
+
+    Returns:
+        list[dict] | tuple[Record, ...]: Registros da coleção (tipados para
+                                         projetos, conteúdos e recomendações)
+    """
+    return _DATA_FILE.get(name)
+
+
+def load_records(name: str) -> tuple[Record, ...]:
+    """
+    Retorna os registros tipados de uma coleção do arquivo de dados padrão.
+
+    O objeto retornado é o mesmo enquanto a coleção não muda, então pode ser
+    usado como origem de coleções indexadas (data/store.py).
+
+    Args:
+        name: Nome da coleção (projects, contents, recommendations)
+
+    Returns:
+        tuple[Record, ...]: Registros imutáveis da coleção
+    """
+    return _DATA_FILE.records(name)
+
+
+def load_record(name: str) -> dict:
+    """
+    Retorna o registro único de uma coleção (ex: about, mentorship).
+
+    Args:
+        name: Nome da coleção
+
+    Returns:
+        dict: Primeiro registro da coleção ou dicionário vazio
+    """
+    records = load_collection(name)
+    return records[0] if records else {}
+
+
+def data_version() -> int:
+    """Retorna um contador incrementado a cada recarga com alterações."""
+    _DATA_FILE.refresh()
+    return _DATA_FILE.version
+
+
+def data_digest() -> str:
+    """
+    Retorna o hash do conteúdo atual de todas as coleções.
+
+    Ao contrário de data_version(), que recomeça em cada processo, o hash é o
+    mesmo em todos os processos que leem os mesmos dados, então pode compor
+    chaves de caches compartilhados entre workers e reinícios.
+    """
+    _DATA_FILE.refresh()
+    return _DATA_FILE.digest
@@ -4,20 +4,14 @@ Módulo de dados de projetos do portfólio.
 Este módulo contém a lista de projetos e funções para acessá-los.
 """
 
-PROJECTS = [
-    {
-        "title": {
-            "pt": "Portfólio Streamlit",
-            "en": "Streamlit Portfolio"
-        },
-        "description": {
-            "pt": "Aplicação web de portfólio pessoal desenvolvida com Streamlit, com suporte a múltiplos idiomas e design responsivo.",
-            "en": "Personal portfolio web application built with Streamlit, featuring multi-language support and responsive design."
-        },
-        "technologies": ["Python", "Streamlit"],
-        "url": "https://github.com/katidieter/portfolio"
-    },
-]
+from data.loader import load_collection, load_records
+
+
+def __getattr__(name):
+    """Mantém PROJECTS acessível como atributo do módulo, lido de data/portfolio.jsonl."""
+    if name == "PROJECTS":
+        return load_collection("projects")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_projects():
@@ -25,7 +19,8 @@ def get_projects():
     Retorna a lista de todos os projetos.
     
     Returns:
-        list[dict]: Lista de dicionários contendo dados dos projetos.
-                   Cada projeto contém title, description, technologies e url.
+        list[Project]: Lista de registros de projeto (data/records.py), que
+                      funcionam como dicionários somente leitura.
+                      Cada projeto contém title, description, technologies e url.
     """
-    return PROJECTS
+    return list(load_records("projects"))
@@ -0,0 +1,180 @@
+"""
+Tipos de registro compactos para as coleções do portfólio.
+
+Projetos, conteúdos e recomendações são lidos de data/portfolio.jsonl como
+dicionários com campos traduzíveis aninhados ({"pt": ..., "en": ...}). Este
+módulo os converte em dataclasses imutáveis com __slots__, em que cada campo
+traduzível é uma tupla indexada pela posição do idioma em LANGUAGES e as
+strings repetidas (tipos, categorias, tags, tecnologias) são internadas com
+sys.intern, de modo que cada valor existe uma única vez em memória.
+
+Os registros são construídos pelo loader (data/loader.py) diretamente na
+leitura do arquivo, sem manter os dicionários de origem. O código de
+renderização lê os campos traduzíveis com record.text(campo, idioma). Os
+registros continuam se comportando como mapeamentos somente leitura no
+formato original (record["title"]["pt"], record.get("url")), então o código
+que recebia dicionários de get_projects, get_contents e get_recommendations
+segue funcionando.
+"""
+
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import ClassVar, Iterator
+
+
+# Idiomas dos campos traduzíveis, na ordem das tuplas; o primeiro é o fallback
+LANGUAGES = ("pt", "en")
+
+# Idioma -> posição na tupla de um campo traduzível
+LANGUAGE_INDEX = {language: index for index, language in enumerate(LANGUAGES)}
+
+# Campo traduzível: um valor por idioma de LANGUAGES (None se não houver tradução)
+Text = tuple[str | None, ...]
+
+
+def _intern(value):
+    """Interna strings e as strings de listas, convertendo listas em tuplas."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(sys.intern(item) if isinstance(item, str) else item for item in value)
+    return value
+
+
+def _text(value) -> Text:
+    """Converte um campo {"pt": ..., "en": ...} em tupla indexada por idioma."""
+    if isinstance(value, str):
+        return (sys.intern(value),) + (None,) * (len(LANGUAGES) - 1)
+    return tuple(
+        sys.intern(value[language]) if isinstance(value.get(language), str) else None
+        for language in LANGUAGES
+    )
+
+
+class Record(Mapping):
+    """
+    Base dos registros tipados: mapeamento somente leitura no formato original.
+
+    Campos ausentes na origem ficam como None e não aparecem no mapeamento,
+    preservando o comportamento de record.get(campo, padrão).
+    """
+
+    __slots__ = ()
+
+    # Campos traduzíveis (tuplas indexadas por idioma)
+    TEXT_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    # Nomes de todos os campos, na ordem da dataclass
+    FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Record":
+        """
+        Constrói o registro a partir de um dicionário lido do arquivo de dados.
+
+        Args:
+            data: Registro no formato de data/portfolio.jsonl
+
+        Returns:
+            Record: Registro imutável com strings internadas
+
+        Raises:
+            ValueError: Se o dicionário possui campos desconhecidos
+        """
+        unknown = data.keys() - set(cls.FIELDS)
+        if unknown:
+            raise ValueError(f"{cls.__name__}: campos desconhecidos {sorted(unknown)}")
+        return cls(**{
+            name: _text(value) if name in cls.TEXT_FIELDS else _intern(value)
+            for name, value in data.items()
+            if value is not None
+        })
+
+    def text(self, field: str, language: str) -> str:
+        """
+        Retorna um campo traduzível no idioma, com fallback para o idioma padrão.
+
+        Args:
+            field: Nome do campo traduzível
+            language: Código do idioma ('pt' ou 'en')
+
+        Returns:
+            str: Texto no idioma ou string vazia se o campo não existe
+        """
+        values = getattr(self, field)
+        if values is None:
+            return ""
+        index = LANGUAGE_INDEX.get(language)
+        value = values[index] if index is not None else None
+        return value if value is not None else values[0] or ""
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None) if key in self.FIELDS else None
+        if value is None:
+            raise KeyError(key)
+        if key in self.TEXT_FIELDS:
+            return {
+                language: text for language, text in zip(LANGUAGES, value) if text is not None
+            }
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name in self.FIELDS if getattr(self, name) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+@dataclass(frozen=True, slots=True)
+class Project(Record):
+    """Projeto do portfólio."""
+
+    TEXT_FIELDS: ClassVar[tuple[str, ...]] = ("title", "description")
+    FIELDS: ClassVar[tuple[str, ...]] = ("title", "description", "technologies", "url")
+
+    title: Text | None = None
+    description: Text | None = None
+    technologies: tuple[str, ...] | None = None
+    url: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Content(Record):
+    """Conteúdo publicado (artigo, vídeo, podcast, tutorial)."""
+
+    TEXT_FIELDS: ClassVar[tuple[str, ...]] = ("title", "description")
+    FIELDS: ClassVar[tuple[str, ...]] = ("title", "description", "type", "url", "date", "tags")
+
+    title: Text | None = None
+    description: Text | None = None
+    type: str | None = None
+    url: str | None = None
+    date: str | None = None
+    tags: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Recommendation(Record):
+    """Recomendação de livro, curso, ferramenta ou artigo."""
+
+    TEXT_FIELDS: ClassVar[tuple[str, ...]] = ("title", "description", "reason")
+    FIELDS: ClassVar[tuple[str, ...]] = (
+        "title", "category", "description", "author_creator", "url", "reason"
+    )
+
+    title: Text | None = None
+    category: str | None = None
+    description: Text | None = None
+    author_creator: str | None = None
+    url: str | None = None
+    reason: Text | None = None
+
+
+# Coleção de data/portfolio.jsonl -> tipo de registro
+RECORD_TYPES: dict[str, type[Record]] = {
+    "projects": Project,
+    "contents": Content,
+    "recommendations": Recommendation,
+}
+
@@ -0,0 +1,261 @@
+"""
+Esquema e normalização dos registros de data/portfolio.jsonl.
+
+Cada registro lido pelo loader (data/loader.py) é validado contra o esquema
+da sua coleção e normalizado uma única vez, na leitura:
+
+- campos obrigatórios ausentes, tipos errados, URLs que não são http(s),
+  datas fora do formato YYYY-MM-DD e valores fora das opções permitidas
+  (tipo de conteúdo, categoria de recomendação) fazem a leitura falhar;
+- campos opcionais ausentes recebem um valor padrão vazio;
+- campos traduzíveis recebem todos os idiomas de LANGUAGES, com o texto do
+  idioma padrão (pt) nos idiomas sem tradução.
+
+Assim as seções podem acessar os registros diretamente
+(about_info["summary"][language]) sem verificações a cada rerun. Executar o
+módulo verifica o arquivo inteiro e lista todos os problemas encontrados:
+
+    python -m data.schema [arquivo.jsonl]
+"""
+
+import json
+import re
+import sys
+from datetime import date
+from typing import NamedTuple
+
+from data.records import LANGUAGES
+
+
+# Tipos de campo
+TEXT = "text"          # {"pt": ..., "en": ...}; o idioma padrão é obrigatório
+TEXTS = "texts"        # lista de campos traduzíveis
+STRING = "string"
+STRINGS = "strings"    # lista de strings
+URL = "url"            # http:// ou https://
+DATE = "date"          # YYYY-MM-DD
+
+# Formato aceito nos campos de data: date.fromisoformat sozinho também aceita
+# "20251230" e datas de semana ISO ("2025-W01-1"), que a ordenação por texto
+# do índice de datas (data/store.py) não compara corretamente
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+class Field(NamedTuple):
+    """Definição de um campo do esquema."""
+
+    kind: str
+    required: bool = False
+    choices: tuple[str, ...] = ()
+
+
+# Tipos de conteúdo aceitos (filtros e rótulos da seção Conteúdos)
+CONTENT_TYPES = ("article", "video", "podcast", "tutorial")
+
+# Categorias de recomendação aceitas (filtros e rótulos da seção Recomendações)
+RECOMMENDATION_CATEGORIES = ("book", "course", "tool", "article")
+
+# Esquema de cada coleção: campo -> definição, na ordem dos registros normalizados
+SCHEMAS: dict[str, dict[str, Field]] = {
+    "about": {
+        "name": Field(STRING, required=True),
+        "profile_image": Field(STRING),
+        "introduction": Field(TEXT),
+        "skills": Field(STRINGS),
+        "technologies": Field(STRINGS),
+        "summary": Field(TEXT),
+    },
+    "projects": {
+        "title": Field(TEXT, required=True),
+        "description": Field(TEXT),
+        "technologies": Field(STRINGS),
+        "url": Field(URL, required=True),
+    },
+    "mentorship": {
+        "description": Field(TEXT),
+        "areas": Field(TEXTS),
+        "availability": Field(TEXT),
+        "contact_url": Field(URL),
+    },
+    "contents": {
+        "title": Field(TEXT, required=True),
+        "description": Field(TEXT),
+        "type": Field(STRING, required=True, choices=CONTENT_TYPES),
+        "url": Field(URL, required=True),
+        "date": Field(DATE),
+        "tags": Field(STRINGS),
+    },
+    "recommendations": {
+        "title": Field(TEXT, required=True),
+        "category": Field(STRING, required=True, choices=RECOMMENDATION_CATEGORIES),
+        "description": Field(TEXT),
+        "author_creator": Field(STRING),
+        "url": Field(URL),
+        "reason": Field(TEXT),
+    },
+    "contact": {
+        "github": Field(URL, required=True),
+        "linkedin": Field(URL, required=True),
+        "medium": Field(URL, required=True),
+    },
+}
+
+# Coleções com exatamente um registro
+SINGLE_RECORD_COLLECTIONS = ("about", "mentorship", "contact")
+
+
+def _empty(kind: str):
+    """Retorna o valor padrão de um campo opcional ausente."""
+    if kind == TEXT:
+        return {language: "" for language in LANGUAGES}
+    if kind in (TEXTS, STRINGS):
+        return []
+    return ""
+
+
+def _normalize_text(value, errors: list[str], name: str) -> dict:
+    """Valida um campo traduzível e preenche os idiomas sem tradução com o idioma padrão."""
+    if isinstance(value, str):
+        value = {LANGUAGES[0]: value}
+    if not isinstance(value, dict) or not all(isinstance(text, str) for text in value.values()):
+        errors.append(f"'{name}' deve ser um objeto idioma -> texto")
+        return _empty(TEXT)
+    if LANGUAGES[0] not in value:
+        errors.append(f"'{name}' não possui o idioma padrão '{LANGUAGES[0]}'")
+        return _empty(TEXT)
+    unknown = value.keys() - set(LANGUAGES)
+    if unknown:
+        errors.append(f"'{name}' possui idiomas não suportados {sorted(unknown)}")
+    return {language: value.get(language, value[LANGUAGES[0]]) for language in LANGUAGES}
+
+
+def _normalize_field(name: str, field: Field, value, errors: list[str]):
+    """Valida e normaliza o valor de um campo presente no registro."""
+    if field.kind == TEXT:
+        return _normalize_text(value, errors, name)
+    if field.kind == TEXTS:
+        if not isinstance(value, list):
+            errors.append(f"'{name}' deve ser uma lista")
+            return []
+        return [_normalize_text(item, errors, f"{name}[{index}]") for index, item in enumerate(value)]
+    if field.kind == STRINGS:
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            errors.append(f"'{name}' deve ser uma lista de textos")
+            return []
+        return value
+
+    if not isinstance(value, str):
+        errors.append(f"'{name}' deve ser um texto")
+        return ""
+    if field.kind == URL and value and not value.lower().startswith(("http://", "https://")):
+        errors.append(f"'{name}' não é uma URL http(s): {value!r}")
+    elif field.kind == DATE and value:
+        try:
+            if not DATE_PATTERN.fullmatch(value):
+                raise ValueError(value)
+            date.fromisoformat(value)
+        except ValueError:
+            errors.append(f"'{name}' não é uma data YYYY-MM-DD: {value!r}")
+    elif field.choices and value not in field.choices:
+        errors.append(f"'{name}' deve ser um de {list(field.choices)}: {value!r}")
+    return value
+
+
+def normalize_record(collection: str, data: dict) -> dict:
+    """
+    Valida um registro contra o esquema da coleção e retorna a versão normalizada.
+
+    Args:
+        collection: Nome da coleção
+        data: Registro lido de data/portfolio.jsonl
+
+    Returns:
+        dict: Registro com todos os campos do esquema, na ordem do esquema
+
+    Raises:
+        ValueError: Com todos os problemas encontrados no registro
+    """
+    schema = SCHEMAS.get(collection)
+    if schema is None:
+        raise ValueError(f"coleção desconhecida '{collection}'")
+    if not isinstance(data, dict):
+        raise ValueError(f"{collection}: o registro deve ser um objeto")
+
+    errors = [f"campo desconhecido '{name}'" for name in data if name not in schema]
+    normalized = {}
+    for name, field in schema.items():
+        value = data.get(name)
+        if value is None or value == "":
+            if field.required:
+                errors.append(f"campo obrigatório '{name}' ausente")
+            normalized[name] = _empty(field.kind)
+        else:
+            normalized[name] = _normalize_field(name, field, value, errors)
+    if errors:
+        raise ValueError(f"{collection}: " + "; ".join(errors))
+    return normalized
+
+
+def check_collections(counts: dict[str, int]) -> list[str]:
+    """
+    Verifica a quantidade de registros das coleções de registro único.
+
+    Args:
+        counts: Coleção -> quantidade de registros lidos
+
+    Returns:
+        list[str]: Problemas encontrados (vazia se o arquivo está completo)
+    """
+    return [
+        f"{collection}: esperado 1 registro, encontrados {counts.get(collection, 0)}"
+        for collection in SINGLE_RECORD_COLLECTIONS
+        if counts.get(collection, 0) != 1
+    ]
+
+
+def validate_file(path: str) -> list[str]:
+    """
+    Valida todos os registros de um arquivo JSON Lines.
+
+    Args:
+        path: Caminho do arquivo de dados
+
+    Returns:
+        list[str]: Problemas encontrados, prefixados por arquivo e linha
+    """
+    errors = []
+    counts: dict[str, int] = {}
+    with open(path, encoding="utf-8") as file:
+        for line_number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                counts[record["collection"]] = counts.get(record["collection"], 0) + 1
+                normalize_record(record["collection"], record["data"])
+            except (ValueError, KeyError, TypeError) as error:
+                errors.append(f"{path}:{line_number}: {error}")
+    return errors + [f"{path}: {error}" for error in check_collections(counts)]
+
+
+def main(argv: list[str]) -> int:
+    """
+    Verifica o arquivo de dados informado (padrão: data/portfolio.jsonl).
+
+    Returns:
+        int: Código de saída (0 se o arquivo é válido)
+    """
+    from data.loader import DATA_FILE
+
+    path = argv[0] if argv else DATA_FILE
+    errors = validate_file(path)
+    for error in errors:
+        print(error)
+    if errors:
+        return 1
+    print(f"OK: {path} segue o esquema de {len(SCHEMAS)} coleções")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,239 @@
+"""
+Módulo de busca textual do portfólio.
+
+Este módulo constrói, uma vez por idioma e por versão dos dados, um índice
+invertido sobre projetos, conteúdos e recomendações (title, description, tags,
+technologies, reason e author_creator). O texto é normalizado sem acentos
+("programação" casa com "programacao"), o último termo da consulta é tratado
+como prefixo e os resultados são ordenados por BM25.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from typing import NamedTuple
+
+from data.content import get_contents
+from data.loader import data_version
+from data.projects import get_projects
+from data.recommendations import get_recommendations
+from data.records import Record
+
+
+# Parâmetros do BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Peso dos campos: quantas vezes os termos de cada campo são contados
+FIELD_WEIGHTS = {
+    "title": 3,
+    "tags": 2,
+    "technologies": 2,
+    "author_creator": 2,
+    "description": 1,
+    "reason": 1
+}
+
+# Quantidade máxima de termos do vocabulário expandidos por um prefixo
+MAX_PREFIX_EXPANSION = 50
+
+# Postings de maior impacto consideradas por termo em consultas com vários termos
+MAX_POSTINGS_PER_TERM = 500
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """
+    Normaliza texto para busca: remove acentos e converte para minúsculas.
+
+    Args:
+        text: Texto original
+
+    Returns:
+        str: Texto sem acentos, em minúsculas
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    """Divide o texto normalizado em termos."""
+    return _TOKEN_PATTERN.findall(fold(text))
+
+
+class SearchResult(NamedTuple):
+    """Resultado de busca: tipo do registro, registro tipado e pontuação."""
+
+    kind: str
+    record: Record
+    score: float
+
+
+class SearchIndex:
+    """
+    Índice invertido com ranking BM25 e consultas por prefixo.
+
+    Os campos traduzíveis dos registros são indexados no idioma do índice.
+    """
+
+    def __init__(self, documents: list[tuple[str, Record]], language: str) -> None:
+        self.documents = documents
+        postings: dict[str, list[tuple[int, int]]] = {}
+        lengths: list[int] = []
+
+        for doc_id, (_, record) in enumerate(documents):
+            frequencies: dict[str, int] = {}
+            for field, weight in FIELD_WEIGHTS.items():
+                value = (
+                    record.text(field, language) if field in record.TEXT_FIELDS
+                    else getattr(record, field, None)
+                )
+                if not value:
+                    continue
+                text = " ".join(value) if isinstance(value, (list, tuple)) else value
+                for term in tokenize(text):
+                    frequencies[term] = frequencies.get(term, 0) + weight
+            lengths.append(sum(frequencies.values()))
+            for term, frequency in frequencies.items():
+                postings.setdefault(term, []).append((doc_id, frequency))
+
+        self._vocabulary = sorted(postings)
+        average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        document_count = len(documents)
+
+        # A contribuição BM25 de cada (termo, documento) não depende da consulta:
+        # é calculada uma vez e as postings ficam ordenadas por impacto decrescente
+        self._impacts: dict[str, tuple[tuple[int, float], ...]] = {}
+        for term, term_postings in postings.items():
+            idf = math.log(1 + (document_count - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+            impacts = [
+                (doc_id, idf * frequency * (BM25_K1 + 1) / (
+                    frequency + BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+                ))
+                for doc_id, frequency in term_postings
+            ]
+            impacts.sort(key=lambda item: item[1], reverse=True)
+            self._impacts[term] = tuple(impacts)
+
+    def expand_prefix(self, prefix: str) -> list[str]:
+        """
+        Retorna os termos do vocabulário que começam com o prefixo.
+
+        Args:
+            prefix: Prefixo já normalizado
+
+        Returns:
+            list[str]: Até MAX_PREFIX_EXPANSION termos em ordem alfabética
+        """
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSION]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, limit: int = 20) -> list[SearchResult]:
+        """
+        Busca os registros mais relevantes para a consulta.
+
+        Todos os termos são buscados exatamente, exceto o último, que também
+        casa como prefixo (busca enquanto o usuário digita).
+
+        Args:
+            query: Consulta em texto livre
+            limit: Quantidade máxima de resultados
+
+        Returns:
+            list[SearchResult]: Resultados ordenados por pontuação decrescente
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        groups = [[term] for term in terms[:-1]]
+        groups.append(self.expand_prefix(terms[-1]) or [terms[-1]])
+        matched = [term for group in groups for term in group if term in self._impacts]
+
+        # Um único termo: as postings já estão ordenadas por pontuação
+        if len(matched) == 1:
+            return [
+                SearchResult(self.documents[doc_id][0], self.documents[doc_id][1], score)
+                for doc_id, score in self._impacts[matched[0]][:limit]
+            ]
+
+        # Vários termos: soma as contribuições, limitando termos muito frequentes
+        # às postings de maior impacto (as demais pouco alteram o topo do ranking)
+        scores: dict[int, float] = {}
+        for term in matched:
+            for doc_id, impact in self._impacts[term][:MAX_POSTINGS_PER_TERM]:
+                scores[doc_id] = scores.get(doc_id, 0.0) + impact
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [
+            SearchResult(self.documents[doc_id][0], self.documents[doc_id][1], score)
+            for doc_id, score in best
+        ]
+
+
+def build_documents() -> list[tuple[str, Record]]:
+    """
+    Reúne os registros pesquisáveis.
+
+    Returns:
+        list[tuple[str, Record]]: Pares (tipo, registro) com tipo project, content ou recommendation
+    """
+    documents: list[tuple[str, Record]] = [("project", project) for project in get_projects()]
+    documents += [("content", content) for content in get_contents()]
+    documents += [("recommendation", rec) for rec in get_recommendations()]
+    return documents
+
+
+# Índices construídos por idioma, compartilhados entre sessões: idioma -> (versão, índice)
+_INDEXES: dict[str, tuple[int, SearchIndex]] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_search_index(language: str) -> SearchIndex:
+    """
+    Retorna o índice do idioma, reconstruindo-o apenas se os dados mudaram.
+
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+
+    Returns:
+        SearchIndex: Índice invertido dos registros no idioma
+    """
+    version = data_version()
+    cached = _INDEXES.get(language)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _INDEXES_LOCK:
+        cached = _INDEXES.get(language)
+        if cached is None or cached[0] != version:
+            cached = (version, SearchIndex(build_documents(), language))
+            _INDEXES[language] = cached
+    return cached[1]
+
+
+def search(query: str, language: str, limit: int = 20) -> list[SearchResult]:
+    """
+    Busca projetos, conteúdos e recomendações no idioma informado.
+
+    Args:
+        query: Consulta em texto livre
+        language: Código do idioma ('pt' ou 'en')
+        limit: Quantidade máxima de resultados
+
+    Returns:
+        list[SearchResult]: Resultados ordenados por relevância
+
+    Examples:
+        >>> search("carreira", "pt")  # conteúdos com "carreira" no título ou nas tags
+    """
+    return get_search_index(language).search(query, limit)
@@ -0,0 +1,171 @@
+"""
+Cache compartilhado entre processos do portfólio.
+
+No modo com vários workers (deploy/run_workers.py), cada processo Streamlit
+teria sua própria cópia de tudo o que é gerado em memória. Este módulo guarda
+artefatos já construídos e serializados (variantes de imagem, HTML
+renderizado) em um diretório compartilhado, de preferência em memória
+(/dev/shm): o primeiro worker que precisa de um artefato o grava, e os demais
+o leem sob demanda, sem reconstruí-lo e sem mantê-lo nos caches do processo.
+Os arquivos ficam uma única vez na memória do sistema (tmpfs), qualquer que
+seja a quantidade de workers; get_text decodifica o HTML direto das páginas
+mapeadas do arquivo, sem cópia intermediária.
+
+O cache é ativado pela variável de ambiente PORTFOLIO_SHARED_CACHE_DIR. Sem ela,
+get_shared_cache() retorna None e cada processo usa apenas seus caches locais.
+As chaves devem identificar o conteúdo (hashes dos dados e do código), pois as
+entradas não expiram: o diretório é limitado a SHARED_CACHE_MAX_ENTRIES
+arquivos, descartando os gravados há mais tempo.
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+from typing import Callable
+
+
+# Variável de ambiente com o diretório do cache compartilhado
+SHARED_CACHE_ENV = "PORTFOLIO_SHARED_CACHE_DIR"
+
+# Quantidade máxima de artefatos no diretório compartilhado
+SHARED_CACHE_MAX_ENTRIES = 2048
+
+# Prefixo dos arquivos temporários de escrita
+_TEMPORARY_PREFIX = ".tmp-"
+
+
+class SharedCache:
+    """
+    Armazenamento chave -> bytes em arquivos, com escrita atômica.
+    """
+
+    def __init__(self, directory: str, max_entries: int = SHARED_CACHE_MAX_ENTRIES) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        """Retorna o caminho do arquivo de uma chave."""
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Lê o valor de uma chave.
+
+        Args:
+            key: Chave do artefato
+
+        Returns:
+            bytes | None: Conteúdo armazenado ou None se a chave não existir
+        """
+        try:
+            with open(self._path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def get_text(self, key: str) -> str | None:
+        """
+        Lê o valor de uma chave como texto UTF-8, decodificado do arquivo mapeado.
+
+        Args:
+            key: Chave do artefato
+
+        Returns:
+            str | None: Conteúdo armazenado ou None se a chave não existir
+        """
+        try:
+            with open(self._path(key), "rb") as file:
+                if not os.fstat(file.fileno()).st_size:
+                    return ""
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return str(mapped, "utf-8")
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """
+        Grava o valor de uma chave de forma atômica (arquivo temporário + rename).
+
+        Args:
+            key: Chave do artefato
+            data: Conteúdo a armazenar
+        """
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, prefix=_TEMPORARY_PREFIX)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Remove os artefatos gravados há mais tempo além de max_entries.
+
+        Returns:
+            int: Quantidade de artefatos removidos
+        """
+        entries = []
+        with os.scandir(self.directory) as scanner:
+            for entry in scanner:
+                if entry.name.startswith(_TEMPORARY_PREFIX):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    pass  # removido por outro worker
+        overflow = len(entries) - self.max_entries
+        if overflow <= 0:
+            return 0
+        removed = 0
+        for _, path in sorted(entries)[:overflow]:
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def get_or_create(self, key: str, builder: Callable[[], bytes]) -> bytes:
+        """
+        Lê o valor da chave ou o constrói e grava se ainda não existir.
+
+        Args:
+            key: Chave do artefato
+            builder: Função que gera o conteúdo
+
+        Returns:
+            bytes: Conteúdo armazenado
+        """
+        data = self.get(key)
+        if data is None:
+            data = builder()
+            self.set(key, data)
+        return data
+
+    def clear(self) -> None:
+        """Remove todos os artefatos do cache."""
+        for name in os.listdir(self.directory):
+            os.unlink(os.path.join(self.directory, name))
+
+
+_SHARED_CACHES: dict[str, SharedCache] = {}
+
+
+def get_shared_cache() -> SharedCache | None:
+    """
+    Retorna o cache compartilhado configurado em PORTFOLIO_SHARED_CACHE_DIR.
+
+    Returns:
+        SharedCache | None: Cache compartilhado ou None se não configurado
+    """
+    directory = os.environ.get(SHARED_CACHE_ENV)
+    if not directory:
+        return None
+    if directory not in _SHARED_CACHES:
+        _SHARED_CACHES[directory] = SharedCache(directory)
+    return _SHARED_CACHES[directory]
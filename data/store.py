@@ -0,0 +1,305 @@
+"""
+Módulo de armazenamento indexado das coleções do portfólio.
+
+Este módulo constrói, uma única vez por processo, índices por campo (tipo,
+categoria, tags, ano) das coleções de dados. As consultas retornam os próprios
+registros tipados (data/records.py), sem cópias por idioma: o código de
+renderização lê os campos traduzíveis com record.text(campo, idioma).
+Coleções com campo de data são ordenadas por data (mais recentes primeiro) na
+construção e respondem a consultas por intervalo de datas com busca binária.
+As consultas retornam em tempo proporcional ao resultado e os índices são
+compartilhados entre todas as sessões, sendo reconstruídos apenas quando a
+coleção de origem muda.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import Callable, Iterable
+
+
+# Idioma usado como fallback quando um campo não possui tradução
+DEFAULT_LANGUAGE = "pt"
+
+# Tamanho do prefixo de uma data ISO (YYYY-MM-DD) para cada período
+PERIOD_LENGTHS = {"year": 4, "month": 7}
+
+
+def field_key(field: str) -> Callable[[dict], Iterable]:
+    """
+    Cria uma função de chave de índice para um campo do registro.
+
+    Campos com listas (ex: tags) são indexados por cada um de seus valores.
+
+    Args:
+        field: Nome do campo
+
+    Returns:
+        Callable: Função que retorna os valores indexáveis do campo
+    """
+    def keys(item: dict) -> Iterable:
+        value = item.get(field)
+        if value is None:
+            return ()
+        if isinstance(value, (list, tuple)):
+            return value
+        return (value,)
+    return keys
+
+
+def year_key(field: str = "date") -> Callable[[dict], Iterable]:
+    """
+    Cria uma função de chave de índice pelo ano de um campo de data ISO.
+
+    Args:
+        field: Nome do campo de data (padrão: date)
+
+    Returns:
+        Callable: Função que retorna o ano (YYYY) da data
+    """
+    def keys(item: dict) -> Iterable:
+        value = item.get(field) or ""
+        return (value[:4],) if value else ()
+    return keys
+
+
+def month_key(field: str = "date") -> Callable[[dict], Iterable]:
+    """
+    Cria uma função de chave de índice pelo mês (YYYY-MM) de um campo de data ISO.
+
+    Args:
+        field: Nome do campo de data (padrão: date)
+
+    Returns:
+        Callable: Função que retorna o mês (YYYY-MM) da data
+    """
+    def keys(item: dict) -> Iterable:
+        value = item.get(field) or ""
+        return (value[:7],) if value else ()
+    return keys
+
+
+def group_by_period(
+    items: list[dict],
+    granularity: str = "month",
+    field: str = "date"
+) -> list[tuple[str, list[dict]]]:
+    """
+    Agrupa registros já ordenados por data em períodos consecutivos.
+
+    Args:
+        items: Registros ordenados por data (ex: resultado de uma consulta por intervalo)
+        granularity: Período de agrupamento ("year" ou "month")
+        field: Nome do campo de data (padrão: date)
+
+    Returns:
+        list[tuple[str, list[dict]]]: (período YYYY ou YYYY-MM, registros), na ordem dos registros
+    """
+    length = PERIOD_LENGTHS[granularity]
+    groups: list[tuple[str, list[dict]]] = []
+    for item in items:
+        period = (item.get(field) or "")[:length]
+        if not groups or groups[-1][0] != period:
+            groups.append((period, []))
+        groups[-1][1].append(item)
+    return groups
+
+
+def localize(item: dict, fields: Iterable[str], language: str) -> dict:
+    """
+    Retorna uma cópia do registro com os campos traduzidos já resolvidos.
+
+    Usado nos registros únicos em dicionário (about, mentorship); registros
+    tipados leem cada campo com record.text(campo, idioma).
+
+    Args:
+        item: Registro original com campos no formato {"pt": ..., "en": ...}
+        fields: Campos traduzíveis a resolver
+        language: Código do idioma ('pt' ou 'en')
+
+    Returns:
+        dict: Registro com cada campo traduzível convertido em string
+    """
+    resolved = dict(item)
+    for field in fields:
+        value = item.get(field)
+        if isinstance(value, dict):
+            resolved[field] = value.get(language, value.get(DEFAULT_LANGUAGE, ""))
+        elif value is None:
+            resolved[field] = ""
+    return resolved
+
+
+class IndexedCollection:
+    """
+    Coleção imutável de registros com índices por campo.
+
+    Os índices são construídos no momento da criação e guardam apenas as
+    posições dos registros, que não são copiados.
+
+    Com date_field, os registros são ordenados uma única vez na construção,
+    dos mais recentes para os mais antigos (registros sem data ficam no final,
+    na ordem original), e todas as consultas seguem essa ordem.
+    """
+
+    def __init__(
+        self,
+        items: list[dict],
+        index_keys: dict[str, Callable[[dict], Iterable]] | None = None,
+        date_field: str | None = None
+    ) -> None:
+        self._source = items
+        self._size = len(items)
+        self.items = tuple(items)
+
+        # Datas em ordem crescente: a data i pertence ao registro na posição
+        # len(_dates) - 1 - i, então um intervalo de datas é uma faixa contínua
+        self._dates: list[str] = []
+        if date_field is not None:
+            self.items = tuple(sorted(
+                self.items,
+                key=lambda item: (bool(item.get(date_field)), item.get(date_field) or ""),
+                reverse=True
+            ))
+            self._dates = [item[date_field] for item in self.items if item.get(date_field)][::-1]
+
+        # Índice: campo -> valor -> posições dos registros
+        self._indexes: dict[str, dict[object, tuple[int, ...]]] = {}
+        for name, keys in (index_keys or {}).items():
+            index: dict[object, list[int]] = {}
+            for position, item in enumerate(self.items):
+                for value in keys(item):
+                    index.setdefault(value, []).append(position)
+            self._indexes[name] = {value: tuple(positions) for value, positions in index.items()}
+
+    def is_built_from(self, items: list[dict]) -> bool:
+        """Indica se a coleção foi construída a partir da lista informada sem alterações."""
+        return self._source is items and self._size == len(items)
+
+    def values(self, name: str) -> list:
+        """Retorna os valores distintos presentes em um índice."""
+        return list(self._indexes.get(name, {}))
+
+    def _positions(self, criteria: dict) -> tuple[int, ...] | range:
+        """Resolve as posições dos registros que atendem a todos os critérios."""
+        positions = None
+        for name, value in criteria.items():
+            if value is None:
+                continue
+            if name not in self._indexes:
+                raise KeyError(f"Índice '{name}' não existe nesta coleção")
+            matches = self._indexes[name].get(value, ())
+            if positions is None:
+                positions = matches
+            else:
+                allowed = set(matches)
+                positions = tuple(p for p in positions if p in allowed)
+        return range(len(self.items)) if positions is None else positions
+
+    def filter(self, **criteria) -> list[dict]:
+        """
+        Retorna os registros que atendem aos critérios.
+
+        Args:
+            **criteria: Pares índice=valor. Valores None são ignorados.
+
+        Returns:
+            list[dict]: Registros na ordem da coleção
+        """
+        return [self.items[p] for p in self._positions(criteria)]
+
+    def _date_positions(self, start: str | None, end: str | None, criteria: dict):
+        """Gera, dos mais recentes para os mais antigos, as posições no intervalo de datas."""
+        count = len(self._dates)
+        low = bisect_left(self._dates, start) if start else 0
+        # Fim inclusivo também para prefixos: "2025" e "2025-12" cobrem o ano e o mês inteiros
+        high = bisect_right(self._dates, end + "\uffff") if end else count
+        positions = range(count - high, count - low)
+        if all(value is None for value in criteria.values()):
+            return iter(positions)
+        allowed = set(self._positions(criteria))
+        return (p for p in positions if p in allowed)
+
+    def between(self, start: str | None = None, end: str | None = None, **criteria) -> list[dict]:
+        """
+        Retorna os registros com data no intervalo, dos mais recentes para os mais antigos.
+
+        Requer uma coleção construída com date_field. Os limites são inclusivos e
+        aceitam datas parciais: between("2024", "2025-06") cobre de 2024-01-01 a 2025-06-30.
+
+        Args:
+            start: Data inicial ISO (YYYY, YYYY-MM ou YYYY-MM-DD). Se None, sem limite.
+            end: Data final ISO (YYYY, YYYY-MM ou YYYY-MM-DD). Se None, sem limite.
+            **criteria: Pares índice=valor. Valores None são ignorados.
+
+        Returns:
+            list[dict]: Registros do intervalo
+        """
+        return [self.items[p] for p in self._date_positions(start, end, criteria)]
+
+    def latest(self, limit: int, **criteria) -> list[dict]:
+        """
+        Retorna os registros mais recentes.
+
+        Args:
+            limit: Quantidade máxima de registros
+            **criteria: Pares índice=valor. Valores None são ignorados.
+
+        Returns:
+            list[dict]: Até limit registros, dos mais recentes para os mais antigos
+        """
+        return [self.items[p] for p in islice(self._date_positions(None, None, criteria), limit)]
+
+    def periods(self, granularity: str = "year") -> list[str]:
+        """
+        Retorna os períodos (YYYY ou YYYY-MM) com registros, dos mais recentes para os mais antigos.
+
+        Args:
+            granularity: "year" ou "month"
+
+        Returns:
+            list[str]: Períodos distintos
+        """
+        length = PERIOD_LENGTHS[granularity]
+        return list(dict.fromkeys(date[:length] for date in reversed(self._dates)))
+
+
+# Coleções construídas, compartilhadas entre todas as sessões do processo
+_COLLECTIONS: dict[str, IndexedCollection] = {}
+
+
+def get_collection(
+    name: str,
+    items: list[dict],
+    index_keys: dict[str, Callable[[dict], Iterable]] | None = None,
+    date_field: str | None = None
+) -> IndexedCollection:
+    """
+    Retorna a coleção indexada, construindo-a apenas se os dados mudaram.
+
+    Args:
+        name: Nome da coleção no cache
+        items: Lista de registros de origem
+        index_keys: Funções de chave por nome de índice
+        date_field: Campo de data para ordenação e consultas por intervalo (opcional)
+
+    Returns:
+        IndexedCollection: Coleção indexada correspondente aos dados atuais
+    """
+    collection = _COLLECTIONS.get(name)
+    if collection is None or not collection.is_built_from(items):
+        collection = IndexedCollection(items, index_keys, date_field)
+        _COLLECTIONS[name] = collection
+    return collection
+
+
+def invalidate(name: str | None = None) -> None:
+    """
+    Descarta coleções construídas para forçar a reconstrução na próxima consulta.
+
+    Args:
+        name: Nome da coleção (opcional). Se None, descarta todas.
+    """
+    if name is None:
+        _COLLECTIONS.clear()
+    else:
+        _COLLECTIONS.pop(name, None)
@@ -2,8 +2,19 @@
 Módulo de traduções para o portfólio Streamlit.
 
 Este módulo contém todas as strings traduzidas para suporte a múltiplos idiomas.
+
+No primeiro uso, as traduções são compiladas em catálogos imutáveis por idioma
+(namedtuple Catalog), com acesso por atributo: get_catalog("en").nav_about.
+Executar o módulo verifica se todos os idiomas cobrem todas as chaves usadas
+em app.py, components/ e sections/:
+
+    python -m data.translations
 """
 
+import os
+import sys
+from collections import namedtuple
+
 TRANSLATIONS = {
     "pt": {
         # Navegação
@@ -62,6 +73,25 @@ TRANSLATIONS = {
         "content_view": "Ver Conteúdo",
         "content_tags": "Tags",
         "content_empty": "Nenhum conteúdo disponível no momento.",
+        "content_display": "Exibição",
+        "content_display_list": "Lista",
+        "content_display_timeline": "Linha do tempo",
+        "content_display_latest": "Mais recentes",
+        "content_year": "Ano",
+        
+        # Busca
+        "search_label": "Buscar",
+        "search_placeholder": "Projetos, conteúdos, recomendações...",
+        "search_results": "Resultados da busca",
+        "search_empty": "Nenhum resultado encontrado.",
+        "search_kind_project": "Projeto",
+        "search_kind_content": "Conteúdo",
+        "search_kind_recommendation": "Recomendação",
+        
+        # Paginação
+        "pagination_previous": "← Anterior",
+        "pagination_next": "Próxima →",
+        "pagination_page": "Página {page} de {total}",
         
         # Seção Contato
         "contact_title": "Entre em Contato",
@@ -142,6 +172,25 @@ TRANSLATIONS = {
         "content_view": "View Content",
         "content_tags": "Tags",
         "content_empty": "No content available at the moment.",
+        "content_display": "View",
+        "content_display_list": "List",
+        "content_display_timeline": "Timeline",
+        "content_display_latest": "Latest",
+        "content_year": "Year",
+        
+        # Search
+        "search_label": "Search",
+        "search_placeholder": "Projects, content, recommendations...",
+        "search_results": "Search results",
+        "search_empty": "No results found.",
+        "search_kind_project": "Project",
+        "search_kind_content": "Content",
+        "search_kind_recommendation": "Recommendation",
+        
+        # Pagination
+        "pagination_previous": "← Previous",
+        "pagination_next": "Next →",
+        "pagination_page": "Page {page} of {total}",
         
         # Contact section
         "contact_title": "Get in Touch",
@@ -193,3 +242,208 @@ def get_translation(key: str, language: str) -> str:
     
     # Retornar tradução ou chave original como fallback
     return TRANSLATIONS[language].get(key, key)
+
+
+# Idioma usado quando o idioma solicitado não é suportado
+DEFAULT_LANGUAGE = "pt"
+
+
+def compile_catalogs(translations: dict[str, dict[str, str]]) -> dict[str, tuple]:
+    """
+    Compila os dicionários de tradução em catálogos imutáveis por idioma.
+    
+    Args:
+        translations: Dicionário idioma -> chave -> texto
+    
+    Returns:
+        dict: Idioma -> Catalog (namedtuple com um campo por chave)
+    
+    Raises:
+        ValueError: Se algum idioma não cobrir todas as chaves dos demais
+    """
+    keys = sorted(set().union(*(texts.keys() for texts in translations.values())))
+    missing = {
+        language: sorted(set(keys) - texts.keys())
+        for language, texts in translations.items()
+        if set(keys) - texts.keys()
+    }
+    if missing:
+        raise ValueError(f"Traduções ausentes por idioma: {missing}")
+    
+    catalog_type = namedtuple("Catalog", keys)
+    return {
+        language: catalog_type(**texts)
+        for language, texts in translations.items()
+    }
+
+
+# Catálogos compilados por idioma, preenchidos no primeiro uso
+_CATALOGS: dict[str, tuple] = {}
+
+
+def get_catalogs() -> dict[str, tuple]:
+    """
+    Retorna os catálogos de todos os idiomas, compilando-os no primeiro uso.
+    
+    A compilação fica fora da importação do módulo para não pesar na
+    inicialização do app (cold start).
+    
+    Returns:
+        dict: Idioma -> Catalog
+    """
+    if not _CATALOGS:
+        _CATALOGS.update(compile_catalogs(TRANSLATIONS))
+    return _CATALOGS
+
+
+def __getattr__(name):
+    """Mantém CATALOGS e o tipo Catalog acessíveis como atributos do módulo, compilados sob demanda."""
+    if name == "CATALOGS":
+        return get_catalogs()
+    if name == "Catalog":
+        return type(get_catalogs()[DEFAULT_LANGUAGE])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_catalog(language: str) -> tuple:
+    """
+    Retorna o catálogo compilado do idioma.
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+    
+    Returns:
+        Catalog: Catálogo imutável com um atributo por chave de tradução
+    
+    Examples:
+        >>> get_catalog("en").nav_about
+        'About'
+    """
+    catalogs = get_catalogs()
+    return catalogs.get(language, catalogs[DEFAULT_LANGUAGE])
+
+
+def negotiate_language(accept_language: str | None, requested: str | None = None) -> str:
+    """
+    Escolhe o idioma da página pelo parâmetro ?lang= ou pelo cabeçalho Accept-Language.
+    
+    O idioma pedido explicitamente tem prioridade. No cabeçalho, vence o idioma
+    suportado de maior peso (q); em caso de empate, o que aparece primeiro.
+    Variantes regionais são reduzidas ao idioma (en-US -> en).
+    
+    Args:
+        accept_language: Valor do cabeçalho Accept-Language (ex: "en-US,en;q=0.9")
+        requested: Idioma pedido na URL (?lang=), se houver
+    
+    Returns:
+        str: Código do idioma suportado ou DEFAULT_LANGUAGE
+    
+    Examples:
+        >>> negotiate_language("en-US,en;q=0.9,pt-BR;q=0.8")
+        'en'
+        >>> negotiate_language("en-US,en;q=0.9", requested="pt")
+        'pt'
+        >>> negotiate_language("de-DE,de;q=0.9")
+        'pt'
+    """
+    if requested:
+        language = requested.strip().lower().split("-")[0]
+        if language in TRANSLATIONS:
+            return language
+    
+    candidates = []
+    for position, entry in enumerate((accept_language or "").split(",")):
+        tag, _, parameters = entry.partition(";")
+        quality = 1.0
+        for parameter in parameters.split(";"):
+            name, _, value = parameter.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        language = tag.strip().lower().split("-")[0]
+        if quality > 0 and language in TRANSLATIONS:
+            candidates.append((-quality, position, language))
+    return min(candidates)[2] if candidates else DEFAULT_LANGUAGE
+
+
+def find_used_keys(path: str) -> set[str]:
+    """
+    Encontra as chaves de tradução usadas em um arquivo Python.
+    
+    Considera chamadas get_translation("chave", ...) com chave literal e
+    acessos a atributos de variáveis chamadas catalog (catalog.chave).
+    
+    Args:
+        path: Caminho do arquivo Python
+    
+    Returns:
+        set[str]: Chaves de tradução referenciadas no arquivo
+    """
+    import ast
+    
+    with open(path, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=path)
+    
+    keys = set()
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "get_translation"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            keys.add(node.args[0].value)
+        elif (
+            isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "catalog"
+            and not node.attr.startswith("_")
+        ):
+            keys.add(node.attr)
+    return keys
+
+
+def check_translations(paths: list[str]) -> dict[str, list[str]]:
+    """
+    Verifica se todos os idiomas cobrem as chaves usadas nos arquivos.
+    
+    Args:
+        paths: Arquivos Python a verificar
+    
+    Returns:
+        dict: Idioma -> chaves usadas e não traduzidas (vazio se tudo estiver coberto)
+    """
+    used = set().union(*(find_used_keys(path) for path in paths))
+    return {
+        language: sorted(used - texts.keys())
+        for language, texts in TRANSLATIONS.items()
+        if used - texts.keys()
+    }
+
+
+def main() -> int:
+    """Verifica as traduções de app.py, components/ e sections/ e imprime as chaves ausentes."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    paths = [os.path.join(root, "app.py")]
+    for package in ("components", "sections"):
+        package_dir = os.path.join(root, package)
+        paths += [
+            os.path.join(package_dir, name)
+            for name in sorted(os.listdir(package_dir))
+            if name.endswith(".py")
+        ]
+    
+    missing = check_translations(paths)
+    for language, keys in missing.items():
+        print(f"{language}: {', '.join(keys)}")
+    if not missing:
+        print(f"OK: {len(TRANSLATIONS)} idiomas cobrem todas as chaves usadas em {len(paths)} arquivos")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
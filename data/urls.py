@@ -0,0 +1,148 @@
+"""
+Canonicalização de URLs do portfólio.
+
+As URLs copiadas do navegador costumam carregar parâmetros de rastreamento
+(utm_*, fbclid, e no caso da Amazon parâmetros de origem da busca e um
+segmento /ref=...) que não mudam o destino, mas são enviados ao navegador em
+toda renderização. Este módulo remove esses parâmetros e normaliza esquema e
+host; data/loader.py aplica canonicalize_record a cada registro lido.
+
+Também gera identificadores curtos e estáveis para URLs longas, usados pela
+exportação estática (python export.py --short-links) para publicar páginas
+locais de redirecionamento em go/<id>.html.
+"""
+
+import hashlib
+import re
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+
+# Parâmetros de rastreamento removidos de qualquer URL
+TRACKING_PARAMETERS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid", "_hsenc", "_hsmi"
+}
+
+# Prefixos de parâmetros de rastreamento (utm_source, pd_rd_w, pf_rd_p, ...)
+TRACKING_PREFIXES = ("utm_", "pd_rd_", "pf_rd_")
+
+# Hosts da Amazon
+AMAZON_HOST_PATTERN = re.compile(r"(^|\.)amazon\.[a-z.]+$")
+
+# Páginas de produto da Amazon: o produto é identificado pelo caminho, toda a query é descartada
+AMAZON_PRODUCT_PATH = re.compile(r"/(dp|gp/product)/")
+
+# Parâmetros de rastreamento das demais páginas da Amazon (busca, listas)
+AMAZON_TRACKING_PARAMETERS = {"ref", "ref_", "qid", "sr", "crid", "sprefix", "dib", "dib_tag"}
+
+# Segmento de rastreamento no caminho das URLs da Amazon (/ref=sr_1_1_sspa)
+AMAZON_REF_SEGMENT = re.compile(r"/ref=[^/]*$")
+
+# Portas padrão removidas do host
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Tamanho a partir do qual uma URL recebe um identificador curto
+SHORT_URL_MIN_LENGTH = 80
+
+# Caracteres dos identificadores curtos
+_SHORT_ID_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def is_tracking_parameter(name: str, amazon: bool = False) -> bool:
+    """Indica se um parâmetro de query é de rastreamento (incluindo os da Amazon, se amazon)."""
+    name = name.lower()
+    return (
+        name in TRACKING_PARAMETERS
+        or name.startswith(TRACKING_PREFIXES)
+        or (amazon and name in AMAZON_TRACKING_PARAMETERS)
+    )
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Remove parâmetros de rastreamento e normaliza esquema, host e porta de uma URL.
+
+    URLs que não são http(s) são retornadas sem alteração.
+
+    Args:
+        url: URL original
+
+    Returns:
+        str: URL canônica
+
+    Examples:
+        >>> canonicalize_url("HTTPS://Medium.com:443/@autor/post?utm_source=x&fbclid=1")
+        'https://medium.com/@autor/post'
+        >>> canonicalize_url("https://www.amazon.com.br/Livro/dp/8576089726/ref=sr_1_1?keywords=x")
+        'https://www.amazon.com.br/Livro/dp/8576089726'
+        >>> canonicalize_url("https://www.amazon.com/s?k=data+science&crid=2X&ref=nb_sb_noss")
+        'https://www.amazon.com/s?k=data+science'
+        >>> canonicalize_url("http://[::1]:8080/x?utm_medium=email")
+        'http://[::1]:8080/x'
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    if parts.username:
+        return url  # credenciais na URL: não normaliza para não alterar o significado
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    host = parts.hostname.rstrip(".")
+    amazon = AMAZON_HOST_PATTERN.search(host) is not None
+    if ":" in host:
+        host = f"[{host}]"  # IPv6: urlsplit remove os colchetes de hostname
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+
+    path = parts.path
+    if amazon:
+        path = AMAZON_REF_SEGMENT.sub("", path)
+    if amazon and AMAZON_PRODUCT_PATH.search(path):
+        query = ""
+    else:
+        # Filtra os pares da query original, preservando a codificação dos valores
+        query = "&".join(
+            pair for pair in parts.query.split("&")
+            if pair and not is_tracking_parameter(unquote_plus(pair.split("=", 1)[0]), amazon)
+        )
+    return urlunsplit((scheme, netloc, path, query, parts.fragment))
+
+
+def canonicalize_record(record: dict) -> dict:
+    """
+    Canonicaliza as URLs de primeiro nível de um registro.
+
+    São consideradas URLs as strings que começam com http:// ou https://
+    (url, contact_url, links de contato).
+
+    Args:
+        record: Registro lido de data/portfolio.jsonl
+
+    Returns:
+        dict: O próprio registro, com as URLs canônicas
+    """
+    for key, value in record.items():
+        if isinstance(value, str) and value[:8].lower().startswith(("http://", "https://")):
+            record[key] = canonicalize_url(value)
+    return record
+
+
+def short_url_id(url: str, length: int = 8) -> str:
+    """
+    Gera um identificador curto e estável para uma URL.
+
+    Args:
+        url: URL (de preferência já canônica)
+        length: Quantidade de caracteres do identificador
+
+    Returns:
+        str: Identificador alfanumérico derivado do hash da URL
+    """
+    number = int.from_bytes(hashlib.sha256(url.encode("utf-8")).digest()[:12], "big")
+    characters = []
+    for _ in range(length):
+        number, index = divmod(number, len(_SHORT_ID_ALPHABET))
+        characters.append(_SHORT_ID_ALPHABET[index])
+    return "".join(characters)
@@ -0,0 +1,103 @@
+"""
+Inicia vários processos do app Streamlit para uso atrás de um proxy reverso.
+
+Cada worker executa `streamlit run app.py` em uma porta própria (a partir de
+--base-port), escutando apenas em 127.0.0.1. Todos os workers recebem o mesmo
+PORTFOLIO_SHARED_CACHE_DIR, de modo que artefatos gerados (variantes de
+imagem, HTML renderizado) são construídos uma vez, ficam uma única vez na
+memória (tmpfs) e são lidos sob demanda pelos workers, sem cópia por processo.
+O proxy (ver deploy/nginx.conf) distribui as conexões com afinidade de sessão.
+Com PORTFOLIO_METRICS_PORT definida, cada worker expõe suas métricas em uma
+porta própria, a partir dela (worker 1: porta informada, worker 2: porta + 1...).
+
+Uso:
+    python deploy/run_workers.py [--workers 4] [--base-port 8501]
+        [--shared-cache-dir /dev/shm/portfolio-cache]
+"""
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+
+
+# Diretório raiz do projeto (onde fica app.py)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Diretório padrão do cache compartilhado: em memória quando disponível
+DEFAULT_SHARED_CACHE_DIR = (
+    "/dev/shm/portfolio-cache" if os.path.isdir("/dev/shm") else os.path.join(ROOT, ".cache", "shared")
+)
+
+
+def start_worker(port: int, shared_cache_dir: str, index: int = 0) -> subprocess.Popen:
+    """
+    Inicia um worker Streamlit em uma porta.
+
+    Args:
+        port: Porta do worker
+        shared_cache_dir: Diretório do cache compartilhado
+        index: Posição do worker (define a porta de métricas)
+
+    Returns:
+        subprocess.Popen: Processo do worker
+    """
+    environment = dict(os.environ, PORTFOLIO_SHARED_CACHE_DIR=shared_cache_dir)
+    metrics_port = os.environ.get("PORTFOLIO_METRICS_PORT")
+    if metrics_port:
+        environment["PORTFOLIO_METRICS_PORT"] = str(int(metrics_port) + index)
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", "app.py",
+            "--server.port", str(port),
+            "--server.address", "127.0.0.1",
+            "--server.headless", "true"
+        ],
+        cwd=ROOT,
+        env=environment
+    )
+
+
+def main() -> int:
+    """Inicia os workers, reinicia os que terminarem e encerra todos ao receber SIGINT/SIGTERM."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Quantidade de workers")
+    parser.add_argument("--base-port", type=int, default=8501, help="Porta do primeiro worker")
+    parser.add_argument("--shared-cache-dir", default=DEFAULT_SHARED_CACHE_DIR,
+                        help="Diretório do cache compartilhado entre workers")
+    args = parser.parse_args()
+
+    os.makedirs(args.shared_cache_dir, exist_ok=True)
+    ports = [args.base_port + index for index in range(args.workers)]
+    workers = {
+        port: start_worker(port, args.shared_cache_dir, index) for index, port in enumerate(ports)
+    }
+    print(f"{args.workers} workers em 127.0.0.1:{ports[0]}-{ports[-1]}, cache em {args.shared_cache_dir}")
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while not stopping:
+        for port, process in workers.items():
+            if process.poll() is not None:
+                print(f"worker {port} terminou com código {process.returncode}; reiniciando")
+                workers[port] = start_worker(port, args.shared_cache_dir, port - args.base_port)
+        time.sleep(1)
+
+    for process in workers.values():
+        process.terminate()
+    for process in workers.values():
+        process.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
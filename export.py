@@ -0,0 +1,466 @@
+"""
+Exportação estática do portfólio.
+
+Gera um arquivo HTML para cada combinação de seção e idioma suportada pelo
+app, com os mesmos dados e traduções, para que o portfólio possa ser servido
+por qualquer servidor de arquivos estáticos sem executar Python por requisição.
+O app Streamlit continua disponível para pré-visualização.
+
+Os assets (CSS e imagem de perfil) são minificados/redimensionados e gravados
+com o hash do conteúdo no nome, podendo ser servidos com cache de longa duração.
+A foto é publicada em um <picture> com variantes AVIF e WebP e o JPEG como
+alternativa para navegadores sem suporte a esses formatos.
+
+O diretório de saída é recriado a cada exportação; um diretório não vazio que
+não seja uma exportação anterior é recusado.
+
+Com --short-links, links externos longos são substituídos por páginas locais
+de redirecionamento (go/<id>.html), reduzindo o tamanho das páginas.
+
+Uso:
+    python export.py [--output dist] [--short-links]
+"""
+
+import argparse
+import hashlib
+import html
+import os
+import re
+import shutil
+
+from components.buttons import BUTTON_STYLES, button_html
+from components.cards import project_grid_html
+from components.images import build_image_variants, picture_html
+from components.listings import content_list_html, recommendation_list_html
+from data.about import get_about_info
+from data.contact import get_contact_info
+from data.content import get_contents
+from data.mentorship import get_mentorship_info
+from data.projects import get_projects
+from data.recommendations import get_recommendations
+from data.store import localize
+from data.translations import CATALOGS, Catalog, DEFAULT_LANGUAGE
+from data.urls import SHORT_URL_MIN_LENGTH, short_url_id
+
+
+# Diretório raiz do projeto (caminhos relativos dos dados partem dele)
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Seções exportadas, na ordem do menu do app
+SECTIONS = ("about", "projects", "mentorship", "recommendations", "content", "contact")
+
+# Entradas de primeiro nível de uma exportação (o diretório pode ser recriado)
+EXPORT_ENTRIES = frozenset({"index.html", "assets", "go", *CATALOGS})
+
+# Links externos em atributos href das páginas geradas
+EXTERNAL_HREF_PATTERN = re.compile(r'href="(https?://[^"]+)"')
+
+# Largura de exibição da foto de perfil, igual à do app
+PROFILE_IMAGE_WIDTH = 250
+
+# Estilos das páginas estáticas, baseados no tema de .streamlit/config.toml
+STYLESHEET = """
+body {
+    margin: 0;
+    font-family: sans-serif;
+    color: #262730;
+    background-color: #ffffff;
+    display: flex;
+    min-height: 100vh;
+}
+nav {
+    width: 16rem;
+    padding: 2rem 1.5rem;
+    background-color: #f0f2f6;
+    flex-shrink: 0;
+}
+nav ul {
+    list-style: none;
+    padding: 0;
+}
+nav li a {
+    display: block;
+    padding: 0.35rem 0;
+    color: #262730;
+    text-decoration: none;
+}
+nav li a.active {
+    color: #0066cc;
+    font-weight: 600;
+}
+main {
+    flex: 1;
+    padding: 2rem 3rem;
+    max-width: 60rem;
+}
+.columns {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(16rem, 1fr));
+    gap: 2rem;
+}
+hr {
+    border: none;
+    border-top: 1px solid #e6e9ef;
+    margin: 2rem 0;
+}
+@media (max-width: 768px) {
+    body {
+        flex-direction: column;
+    }
+    nav {
+        width: auto;
+    }
+    main {
+        padding: 1.5rem;
+    }
+}
+"""
+
+
+def minify_css(css: str) -> str:
+    """Remove comentários e espaços desnecessários de uma folha de estilos."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_html(document: str) -> str:
+    """Remove indentação e quebras de linha entre tags de um documento HTML."""
+    return re.sub(r">\s*\n\s*<", "><", document).strip()
+
+
+def shorten_links(document: str, redirects: dict[str, str]) -> str:
+    """
+    Substitui links externos longos por páginas locais de redirecionamento.
+
+    Args:
+        document: Página HTML de uma seção (em <idioma>/)
+        redirects: Identificador curto -> URL, preenchido com os links substituídos
+
+    Returns:
+        str: Página com href="../go/<id>.html" no lugar das URLs longas
+    """
+    def replace(match: re.Match) -> str:
+        url = html.unescape(match.group(1))
+        if len(url) < SHORT_URL_MIN_LENGTH:
+            return match.group(0)
+        short_id = short_url_id(url)
+        redirects[short_id] = url
+        return f'href="../go/{short_id}.html"'
+
+    return EXTERNAL_HREF_PATTERN.sub(replace, document)
+
+
+def redirect_page(url: str) -> str:
+    """Gera uma página HTML que redireciona imediatamente para a URL."""
+    target = html.escape(url)
+    return minify_html(f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+        <meta name="robots" content="noindex">
+        <meta http-equiv="refresh" content="0; url={target}">
+    </head>
+    <body><a href="{target}">{target}</a></body>
+    </html>
+    """)
+
+
+def write_asset(output_dir: str, name: str, extension: str, data: bytes) -> str:
+    """
+    Grava um asset com o hash do conteúdo no nome do arquivo.
+
+    Args:
+        output_dir: Diretório raiz da exportação
+        name: Nome base do asset
+        extension: Extensão do arquivo (sem ponto)
+        data: Conteúdo do asset
+
+    Returns:
+        str: Caminho do asset relativo ao diretório raiz
+    """
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    relative_path = f"assets/{name}.{digest}.{extension}"
+    with open(os.path.join(output_dir, relative_path), "wb") as file:
+        file.write(data)
+    return relative_path
+
+
+def _text(value: str) -> str:
+    """Escapa texto para HTML."""
+    return html.escape(value or "")
+
+
+def _list(items: list[str]) -> str:
+    """Renderiza uma lista HTML não ordenada."""
+    return "<ul>" + "".join(f"<li>{_text(item)}</li>" for item in items) + "</ul>"
+
+
+def render_about(language: str, catalog: Catalog, assets: dict) -> str:
+    """Renderiza o corpo HTML da seção Sobre."""
+    about_info = localize(get_about_info(), ("introduction", "summary"), language)
+    variants = assets.get("profile_image_variants")
+    photo = (
+        picture_html(
+            variants,
+            {digest: f"../{path}" for digest, path in assets["profile_images"].items()},
+            PROFILE_IMAGE_WIDTH,
+            about_info["name"]
+        )
+        if variants else "<h2>👨‍💻</h2>"
+    )
+    return (
+        f"<h1>{_text(catalog.about_title)}</h1>"
+        f'<div class="columns"><div>{photo}</div>'
+        f'<div><h2>{_text(about_info["name"])}</h2>'
+        f'<p>{_text(about_info["introduction"])}</p></div></div><hr>'
+        f'<div class="columns">'
+        f'<div><h3>{_text(catalog.about_skills)}</h3>{_list(about_info["skills"])}</div>'
+        f'<div><h3>{_text(catalog.about_technologies)}</h3>'
+        f'{_list(about_info["technologies"])}</div></div><hr>'
+        f'<h3>{_text(catalog.about_summary)}</h3><p>{_text(about_info["summary"])}</p>'
+    )
+
+
+def render_projects(language: str, catalog: Catalog, assets: dict) -> str:
+    """Renderiza o corpo HTML da seção Projetos com o mesmo grid do app."""
+    projects = get_projects()
+    if not projects:
+        return f"<h1>{_text(catalog.nav_projects)}</h1><p>{_text(catalog.projects_empty)}</p>"
+    return f"<h1>{_text(catalog.nav_projects)}</h1>{project_grid_html(projects, language)}"
+
+
+def render_mentorship(language: str, catalog: Catalog, assets: dict) -> str:
+    """Renderiza o corpo HTML da seção Mentoria."""
+    mentorship_info = localize(get_mentorship_info(), ("description", "availability"), language)
+    areas = [area[language] for area in mentorship_info["areas"]]
+    contact_url = mentorship_info["contact_url"]
+    schedule = (
+        f"<hr><h3>{_text(catalog.mentorship_schedule)}</h3>"
+        f"{button_html(catalog.mentorship_schedule, contact_url)}"
+        if contact_url else ""
+    )
+    return (
+        f"<h1>{_text(catalog.nav_mentorship)}</h1>"
+        f"<h3>{_text(catalog.mentorship_description)}</h3>"
+        f'<p>{_text(mentorship_info["description"])}</p><hr><div class="columns">'
+        f"<div><h3>{_text(catalog.mentorship_areas)}</h3>{_list(areas)}</div>"
+        f"<div><h3>{_text(catalog.mentorship_availability)}</h3>"
+        f'<p>{_text(mentorship_info["availability"])}</p></div></div>{schedule}'
+    )
+
+
+def render_recommendations(language: str, catalog: Catalog, assets: dict) -> str:
+    """Renderiza o corpo HTML da seção Recomendações (sem filtro) com a mesma lista do app."""
+    recommendations = get_recommendations()
+    if not recommendations:
+        return (
+            f"<h1>{_text(catalog.recommendations_title)}</h1>"
+            f"<p>{_text(catalog.recommendations_empty)}</p>"
+        )
+
+    category_labels = {
+        "book": catalog.recommendations_book,
+        "course": catalog.recommendations_course,
+        "tool": catalog.recommendations_tool,
+        "article": catalog.recommendations_article
+    }
+    return (
+        f"<h1>{_text(catalog.recommendations_title)}</h1><hr>"
+        + recommendation_list_html(recommendations, language, catalog, category_labels)
+    )
+
+
+def render_content(language: str, catalog: Catalog, assets: dict) -> str:
+    """Renderiza o corpo HTML da seção Conteúdos (sem filtro) com a mesma lista do app."""
+    contents = get_contents()
+    if not contents:
+        return f"<h1>{_text(catalog.content_title)}</h1><p>{_text(catalog.content_empty)}</p>"
+
+    type_labels = {
+        "article": catalog.content_article,
+        "video": catalog.content_video,
+        "podcast": catalog.content_podcast,
+        "tutorial": catalog.content_tutorial
+    }
+    return (
+        f"<h1>{_text(catalog.content_title)}</h1><hr>"
+        + content_list_html(contents, language, catalog, type_labels)
+    )
+
+
+def render_contact(language: str, catalog: Catalog, assets: dict) -> str:
+    """Renderiza o corpo HTML da seção Contato."""
+    contact_info = get_contact_info()
+    return (
+        f"<h1>{_text(catalog.contact_title)}</h1><p>{_text(catalog.contact_intro)}</p><hr>"
+        f"<h3>{_text(catalog.contact_github)}</h3>"
+        f'{button_html(catalog.contact_follow, contact_info["github"], "#333333")}'
+        f"<h3>{_text(catalog.contact_linkedin)}</h3>"
+        f'{button_html(catalog.contact_connect, contact_info["linkedin"], "#0077B5")}'
+        f"<h3>Medium</h3>"
+        f'{button_html(catalog.contact_follow, contact_info["medium"], "#000000")}'
+    )
+
+
+# Função de renderização de cada seção exportada
+SECTION_RENDERERS = {
+    "about": render_about,
+    "projects": render_projects,
+    "mentorship": render_mentorship,
+    "recommendations": render_recommendations,
+    "content": render_content,
+    "contact": render_contact
+}
+
+
+def render_page(section: str, language: str, catalog: Catalog, body: str, assets: dict) -> str:
+    """
+    Monta o documento HTML completo de uma página, com menu e seletor de idioma.
+
+    Args:
+        section: Seção da página
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções do idioma
+        body: Corpo HTML da seção
+        assets: Caminhos dos assets gravados
+
+    Returns:
+        str: Documento HTML minificado
+    """
+    active = ' class="active"'
+    languages = "".join(
+        f'<li><a href="../{code}/{section}.html"{active if code == language else ""}>'
+        f"{_text(getattr(catalog, f'language_{code}'))}</a></li>"
+        for code in CATALOGS
+    )
+    menu = "".join(
+        f'<li><a href="{name}.html"{active if name == section else ""}>'
+        f"{_text(getattr(catalog, f'nav_{name}'))}</a></li>"
+        for name in SECTIONS
+    )
+    document = f"""
+    <!DOCTYPE html>
+    <html lang="{language}">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <title>Portfolio - {_text(getattr(catalog, f'nav_{section}'))}</title>
+        <link rel="stylesheet" href="../{assets['stylesheet']}">
+    </head>
+    <body>
+        <nav>
+            <h3>{_text(catalog.language_selector)}</h3>
+            <ul>{languages}</ul>
+            <hr>
+            <h3>Menu</h3>
+            <ul>{menu}</ul>
+        </nav>
+        <main>{body}</main>
+    </body>
+    </html>
+    """
+    return minify_html(document)
+
+
+def export_site(output_dir: str, short_links: bool = False) -> list[str]:
+    """
+    Exporta todas as combinações de seção e idioma para arquivos HTML.
+
+    Args:
+        output_dir: Diretório de saída (recriado a cada exportação)
+        short_links: Substitui links externos longos por páginas go/<id>.html
+
+    Returns:
+        list[str]: Caminhos relativos dos arquivos gerados
+
+    Raises:
+        ValueError: Se output_dir não está vazio e não é uma exportação anterior
+    """
+    if os.path.isdir(output_dir) and os.listdir(output_dir):
+        if not set(os.listdir(output_dir)) <= EXPORT_ENTRIES:
+            raise ValueError(
+                f"{output_dir} não está vazio e não é uma exportação anterior; "
+                "escolha um diretório vazio ou novo"
+            )
+        shutil.rmtree(output_dir)
+    os.makedirs(os.path.join(output_dir, "assets"), exist_ok=True)
+
+    stylesheet = minify_css(STYLESHEET + re.sub(r"</?style>", "", BUTTON_STYLES))
+    assets = {"stylesheet": write_asset(output_dir, "style", "css", stylesheet.encode("utf-8"))}
+    written = [assets["stylesheet"]]
+
+    # Caminho da foto relativo à raiz do projeto, independente do diretório atual
+    profile_image_path = get_about_info()["profile_image"]
+    if profile_image_path:
+        profile_image_path = os.path.join(ROOT, profile_image_path)
+    if profile_image_path and os.path.isfile(profile_image_path):
+        variants = build_image_variants(profile_image_path, PROFILE_IMAGE_WIDTH)
+        assets["profile_image_variants"] = variants
+        assets["profile_images"] = {
+            variant.digest: write_asset(
+                output_dir,
+                f"profile-{variant.width}w",
+                variant.mimetype.split("/")[1].replace("jpeg", "jpg"),
+                variant.data
+            )
+            for variant in variants
+        }
+        written.extend(assets["profile_images"].values())
+
+    redirects: dict[str, str] = {}
+    for language, catalog in CATALOGS.items():
+        os.makedirs(os.path.join(output_dir, language), exist_ok=True)
+        for section in SECTIONS:
+            body = SECTION_RENDERERS[section](language, catalog, assets)
+            page = render_page(section, language, catalog, body, assets)
+            if short_links:
+                page = shorten_links(page, redirects)
+            relative_path = f"{language}/{section}.html"
+            with open(os.path.join(output_dir, relative_path), "w", encoding="utf-8") as file:
+                file.write(page)
+            written.append(relative_path)
+
+    if redirects:
+        os.makedirs(os.path.join(output_dir, "go"))
+        for short_id, url in sorted(redirects.items()):
+            relative_path = f"go/{short_id}.html"
+            with open(os.path.join(output_dir, relative_path), "w", encoding="utf-8") as file:
+                file.write(redirect_page(url))
+            written.append(relative_path)
+
+    # Página inicial redireciona para a seção Sobre no idioma padrão
+    index = minify_html(f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="utf-8">
+        <meta http-equiv="refresh" content="0; url={DEFAULT_LANGUAGE}/about.html">
+    </head>
+    </html>
+    """)
+    with open(os.path.join(output_dir, "index.html"), "w", encoding="utf-8") as file:
+        file.write(index)
+    written.append("index.html")
+    return written
+
+
+def main() -> None:
+    """Executa a exportação pela linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="dist", help="Diretório de saída (padrão: dist)")
+    parser.add_argument("--short-links", action="store_true",
+                        help="Substitui links externos longos por páginas de redirecionamento go/<id>.html")
+    args = parser.parse_args()
+
+    try:
+        written = export_site(args.output, args.short_links)
+    except ValueError as error:
+        parser.error(str(error))
+    print(f"{len(written)} arquivos gerados em {args.output}/")
+
+
+if __name__ == "__main__":
+    main()
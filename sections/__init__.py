@@ -0,0 +1,50 @@
+"""
+Registro de seções do portfólio Streamlit.
+
+Cada seção vive em seu próprio módulo, junto com os módulos de dados e
+componentes que usa. O registro guarda apenas o caminho de cada renderizador:
+o módulo é importado na primeira vez que a seção é exibida, de modo que a
+inicialização do app (cold start) não paga pela importação de seções que a
+sessão ainda não abriu.
+"""
+
+import importlib
+import threading
+from typing import Callable
+
+
+# Seção -> (módulo, função de renderização), na ordem do menu de navegação
+SECTIONS = {
+    "about": ("sections.about", "render_about_section"),
+    "projects": ("sections.projects", "render_projects_section"),
+    "mentorship": ("sections.mentorship", "render_mentorship_section"),
+    "recommendations": ("sections.recommendations", "render_recommendations_section"),
+    "content": ("sections.content", "render_content_section"),
+    "contact": ("sections.contact", "render_contact_section"),
+    "search": ("sections.search", "render_search_results"),
+}
+
+# Renderizadores já importados, compartilhados entre sessões
+_RENDERERS: dict[str, Callable] = {}
+_RENDERERS_LOCK = threading.Lock()
+
+
+def get_section_renderer(section: str) -> Callable | None:
+    """
+    Retorna a função de renderização da seção, importando seu módulo no primeiro uso.
+
+    Args:
+        section: Nome da seção (ex: 'about', 'projects', 'search')
+
+    Returns:
+        Callable | None: Função de renderização ou None se a seção não estiver registrada
+    """
+    renderer = _RENDERERS.get(section)
+    if renderer is not None or section not in SECTIONS:
+        return renderer
+
+    with _RENDERERS_LOCK:
+        if section not in _RENDERERS:
+            module_name, function_name = SECTIONS[section]
+            _RENDERERS[section] = getattr(importlib.import_module(module_name), function_name)
+    return _RENDERERS[section]
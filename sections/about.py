@@ -0,0 +1,88 @@
+"""Seção Sobre: foto de perfil, apresentação, habilidades, tecnologias e resumo profissional."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.about import get_about_info
+from components.images import render_responsive_image
+from components.instrumentation import instrumented
+
+
+@st.fragment
+@instrumented("section:about")
+def render_about_section(language: str, catalog: Catalog) -> None:
+    """
+    Renderiza a seção Sobre com informações profissionais.
+    
+    Exibe:
+    - Foto de perfil
+    - Introdução profissional traduzida
+    - Skills e tecnologias
+    - Resumo profissional
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    
+    Requisitos: 4.1, 4.2, 4.3, 4.4
+    """
+    about_info = get_about_info()
+    
+    # Título da seção
+    st.title(catalog.about_title)
+    
+    # Layout com colunas para foto e introdução
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        # Exibir foto de perfil se existir, caso contrário usar emoji
+        profile_image_path = about_info["profile_image"]
+        if not (profile_image_path and render_responsive_image(
+            profile_image_path, width=250, alt=about_info["name"]
+        )):
+            # Usar emoji como avatar padrão se imagem não existir
+            st.markdown("## 👨‍💻")
+            st.caption("Foto de perfil")
+    
+    with col2:
+        # Nome
+        st.header(about_info["name"])
+        
+        # Introdução profissional traduzida
+        introduction = about_info["introduction"][language]
+        if introduction:
+            st.markdown(introduction)
+    
+    st.divider()
+    
+    # Skills e Tecnologias em colunas
+    col_skills, col_tech = st.columns(2)
+    
+    with col_skills:
+        st.subheader(catalog.about_skills)
+        skills = about_info["skills"]
+        if skills:
+            # Exibir skills como badges/pills
+            for skill in skills:
+                st.markdown(f"- {skill}")
+        else:
+            st.info("Nenhuma habilidade cadastrada.")
+    
+    with col_tech:
+        st.subheader(catalog.about_technologies)
+        technologies = about_info["technologies"]
+        if technologies:
+            # Exibir tecnologias como badges/pills
+            for tech in technologies:
+                st.markdown(f"- {tech}")
+        else:
+            st.info("Nenhuma tecnologia cadastrada.")
+    
+    st.divider()
+    
+    # Resumo profissional
+    st.subheader(catalog.about_summary)
+    summary = about_info["summary"][language]
+    if summary:
+        st.markdown(summary)
+    else:
+        st.info("Resumo profissional não disponível.")
@@ -0,0 +1,70 @@
+"""Seção de Contato: botões para GitHub, LinkedIn e Medium."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.contact import get_contact_info
+from components.buttons import create_custom_button
+from components.instrumentation import instrumented
+
+
+@st.fragment
+@instrumented("section:contact")
+def render_contact_section(language: str, catalog: Catalog) -> None:
+    """
+    Renderiza a seção de Contato com botões para redes sociais e email.
+    
+    Exibe botões customizados para:
+    - Email
+    - LinkedIn
+    - GitHub
+    - Medium
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    
+    Requisitos: 7.1, 7.2, 7.3
+    """
+    # Título da seção
+    st.title(catalog.contact_title)
+    
+    # Descrição introdutória
+    st.markdown(catalog.contact_intro)
+    
+    st.divider()
+    
+    # Informações de contato (registro "contact" em data/portfolio.jsonl)
+    contact_info = get_contact_info()
+    
+    # Layout em colunas para organizar os botões
+    col1, col2 = st.columns(2)
+    
+    with col1:        
+        # Botão do GitHub
+        st.subheader(catalog.contact_github)
+        create_custom_button(
+            text=catalog.contact_follow,
+            url=contact_info['github'],
+            background_color="#333333",
+            text_color="#ffffff"
+        )
+    
+        # Botão do LinkedIn
+        st.subheader(catalog.contact_linkedin)
+        create_custom_button(
+            text=catalog.contact_connect,
+            url=contact_info['linkedin'],
+            background_color="#0077B5",
+            text_color="#ffffff"
+        )
+        
+        st.markdown("")  # Espaçamento
+        
+        # Botão do Medium
+        st.subheader("Medium")
+        create_custom_button(
+            text=catalog.contact_follow,
+            url=contact_info['medium'],
+            background_color="#000000",
+            text_color="#ffffff"
+        )
@@ -0,0 +1,166 @@
+"""Seção de Conteúdos: lista paginada, linha do tempo e mais recentes, filtráveis por tipo."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.content import (
+    get_content_periods,
+    get_contents,
+    get_contents_between,
+    get_latest_contents,
+)
+from data.store import group_by_period
+from components.listings import content_list_html, content_timeline_html, render_listing
+from components.pagination import get_page_slice, render_pagination, reset_page
+from components.instrumentation import instrumented
+
+
+# Quantidade de conteúdos exibidos na visão "Mais recentes"
+LATEST_CONTENTS = 5
+
+# Chaves do session_state com a página atual da lista e da linha do tempo
+PAGE_KEYS = ("content_page", "content_timeline_page")
+
+
+def _reset_pages() -> None:
+    """Callback do filtro: volta a lista e a linha do tempo para a primeira página."""
+    for state_key in PAGE_KEYS:
+        reset_page(state_key)
+
+
+def _render_timeline(language: str, catalog: Catalog, selected_filter, filter_options: dict) -> None:
+    """
+    Renderiza os conteúdos de um ano agrupados por mês, do mais recente ao mais antigo.
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+        selected_filter: Tipo de conteúdo selecionado (None para todos)
+        filter_options: Tipo de conteúdo -> rótulo traduzido
+    """
+    years = get_content_periods("year")
+    if not years:
+        st.info(catalog.content_empty)
+        return
+    
+    year = st.selectbox(
+        label=catalog.content_year,
+        options=years,
+        key="content_year_selector",
+        on_change=reset_page,
+        args=("content_timeline_page",)
+    )
+    
+    # Consulta por intervalo sobre o índice de datas (sem percorrer a coleção)
+    contents = get_contents_between(year, year, content_type=selected_filter)
+    if not contents:
+        st.info(catalog.content_empty)
+        return
+    
+    page = get_page_slice("content_timeline_page", len(contents))
+    render_listing(
+        ("content", "timeline", language, selected_filter, year, page.start, page.stop),
+        lambda: content_timeline_html(group_by_period(contents[page]), language, catalog, filter_options)
+    )
+    
+    render_pagination("content_timeline_page", len(contents), catalog)
+
+
+@st.fragment
+@instrumented("section:content")
+def render_content_section(language: str, catalog: Catalog) -> None:
+    """
+    Renderiza a seção de Conteúdos com lista de conteúdos publicados.
+    
+    Carrega conteúdos de data/content.py, do mais recente ao mais antigo, e exibe:
+    - Título, descrição, tipo e tags de cada conteúdo
+    - Filtro opcional por tipo de conteúdo
+    - Visões em lista paginada, linha do tempo (por ano, agrupada por mês)
+      e os LATEST_CONTENTS mais recentes
+    - Botão para visualizar cada conteúdo
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    
+    Requisitos: 8.2
+    """
+    # Título da seção
+    st.title(catalog.content_title)
+    
+    # Layout responsivo para filtro - usar colunas para melhor organização
+    col_filter, col_view = st.columns([2, 3])
+    
+    with col_filter:
+        # Filtro por tipo de conteúdo
+        st.subheader(catalog.content_filter)
+        
+        # Opções de filtro
+        filter_options = {
+            None: catalog.content_all,
+            "article": catalog.content_article,
+            "video": catalog.content_video,
+            "podcast": catalog.content_podcast,
+            "tutorial": catalog.content_tutorial
+        }
+        
+        # Selectbox para filtro
+        selected_filter = st.selectbox(
+            label="",
+            options=list(filter_options.keys()),
+            format_func=lambda x: filter_options[x],
+            key="content_filter_selector",
+            on_change=_reset_pages
+        )
+    
+    with col_view:
+        # Forma de exibição dos conteúdos
+        st.subheader(catalog.content_display)
+        
+        view_options = {
+            "list": catalog.content_display_list,
+            "timeline": catalog.content_display_timeline,
+            "latest": catalog.content_display_latest
+        }
+        
+        view = st.radio(
+            label=catalog.content_display,
+            options=list(view_options.keys()),
+            format_func=lambda x: view_options[x],
+            key="content_view_selector",
+            horizontal=True,
+            label_visibility="collapsed"
+        )
+    
+    st.divider()
+    
+    if view == "timeline":
+        _render_timeline(language, catalog, selected_filter, filter_options)
+        return
+    
+    if view == "latest":
+        contents = get_latest_contents(LATEST_CONTENTS, content_type=selected_filter)
+        if not contents:
+            st.info(catalog.content_empty)
+            return
+        render_listing(
+            ("content", "latest", language, selected_filter, LATEST_CONTENTS),
+            lambda: content_list_html(contents, language, catalog, filter_options)
+        )
+        return
+    
+    # Carregar conteúdos com filtro aplicado
+    contents = get_contents(content_type=selected_filter)
+    
+    # Verificar se há conteúdos
+    if not contents:
+        st.info(catalog.content_empty)
+        return
+    
+    # Exibir apenas os conteúdos da página atual em layout responsivo
+    page = get_page_slice("content_page", len(contents))
+    render_listing(
+        ("content", "list", language, selected_filter, page.start, page.stop),
+        lambda: content_list_html(contents[page], language, catalog, filter_options)
+    )
+    
+    render_pagination("content_page", len(contents), catalog)
@@ -0,0 +1,84 @@
+"""Seção de Mentoria: descrição, áreas de atuação, disponibilidade e link de agendamento."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.mentorship import get_mentorship_info
+from components.buttons import create_custom_button
+from components.instrumentation import instrumented
+
+
+@st.fragment
+@instrumented("section:mentorship")
+def render_mentorship_section(language: str, catalog: Catalog) -> None:
+    """
+    Renderiza a seção de Mentoria com informações sobre serviços de mentoria.
+    
+    Carrega informações de data/mentorship.py e exibe:
+    - Descrição dos serviços de mentoria
+    - Áreas de mentoria oferecidas
+    - Disponibilidade
+    - Botão para agendamento
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    
+    Requisitos: 8.2
+    """
+    # Título da seção
+    st.title(catalog.nav_mentorship)
+    
+    # Carregar informações de mentoria
+    mentorship_info = get_mentorship_info()
+    
+    # Descrição
+    st.subheader(catalog.mentorship_description)
+    description = mentorship_info["description"][language]
+    if description:
+        st.markdown(description)
+    else:
+        st.info("Descrição não disponível.")
+    
+    st.divider()
+    
+    # Layout responsivo com colunas para áreas e disponibilidade
+    col_areas, col_availability = st.columns([3, 2])
+    
+    with col_areas:
+        # Áreas de mentoria
+        st.subheader(catalog.mentorship_areas)
+        areas = mentorship_info["areas"]
+        if areas:
+            for area in areas:
+                area_text = area[language]
+                if area_text:
+                    st.markdown(f"- {area_text}")
+        else:
+            st.info("Áreas de mentoria não disponíveis.")
+    
+    with col_availability:
+        # Disponibilidade
+        st.subheader(catalog.mentorship_availability)
+        availability = mentorship_info["availability"][language]
+        if availability:
+            st.markdown(availability)
+        else:
+            st.info("Informação de disponibilidade não disponível.")
+    
+    st.divider()
+    
+    # Botão para agendamento - centralizado
+    contact_url = mentorship_info["contact_url"]
+    if contact_url:
+        st.subheader(catalog.mentorship_schedule)
+        # Usar colunas para centralizar o botão
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col2:
+            create_custom_button(
+                text=catalog.mentorship_schedule,
+                url=contact_url,
+                background_color="#0066cc",
+                text_color="#ffffff"
+            )
+    else:
+        st.warning("Link de agendamento não disponível.")
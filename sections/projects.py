@@ -0,0 +1,32 @@
+"""Seção de Projetos: grid de cards com descrição, tecnologias e link de cada projeto."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.projects import get_projects
+from components.cards import render_projects_grid
+from components.instrumentation import instrumented
+
+
+@st.fragment
+@instrumented("section:projects")
+def render_projects_section(language: str, catalog: Catalog) -> None:
+    """
+    Renderiza a seção de Projetos com lista de projetos.
+    
+    Carrega projetos de data/projects.py e usa render_projects_grid
+    para exibir em layout organizado.
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    
+    Requisitos: 5.1, 5.4
+    """
+    # Título da seção
+    st.title(catalog.nav_projects)
+    
+    # Carregar projetos
+    projects = get_projects()
+    
+    # Renderizar projetos usando o grid, com o HTML em cache por idioma
+    render_projects_grid(projects, language, cache_key=("projects",))
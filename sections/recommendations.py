@@ -0,0 +1,74 @@
+"""Seção de Recomendações: livros, cursos, ferramentas e artigos, paginados e filtráveis."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.recommendations import get_recommendations
+from components.listings import recommendation_list_html, render_listing
+from components.pagination import get_page_slice, render_pagination, reset_page
+from components.instrumentation import instrumented
+
+
+@st.fragment
+@instrumented("section:recommendations")
+def render_recommendations_section(language: str, catalog: Catalog) -> None:
+    """
+    Renderiza a seção de Recomendações com lista de recursos recomendados.
+    
+    Carrega recomendações de data/recommendations.py e exibe:
+    - Título, categoria, descrição, autor/criador e motivo de cada recomendação
+    - Filtro opcional por categoria (livros, cursos, ferramentas, etc.)
+    - Botão/link para acessar o recurso recomendado
+    
+    Args:
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    
+    Requisitos: 7.1, 7.2, 7.3, 7.4
+    """
+    # Título da seção
+    st.title(catalog.recommendations_title)
+    
+    # Layout responsivo para filtro - usar colunas para melhor organização
+    col_filter, col_spacer = st.columns([2, 3])
+    
+    with col_filter:
+        # Filtro por categoria
+        st.subheader(catalog.recommendations_filter)
+        
+        # Opções de filtro
+        filter_options = {
+            None: catalog.recommendations_all,
+            "book": catalog.recommendations_book,
+            "course": catalog.recommendations_course,
+            "tool": catalog.recommendations_tool,
+            "article": catalog.recommendations_article
+        }
+        
+        # Selectbox para filtro
+        selected_filter = st.selectbox(
+            label="",
+            options=list(filter_options.keys()),
+            format_func=lambda x: filter_options[x],
+            key="recommendations_filter_selector",
+            on_change=reset_page,
+            args=("recommendations_page",)
+        )
+    
+    st.divider()
+    
+    # Carregar recomendações com filtro aplicado
+    recommendations = get_recommendations(category=selected_filter)
+    
+    # Verificar se há recomendações
+    if not recommendations:
+        st.info(catalog.recommendations_empty)
+        return
+    
+    # Exibir apenas as recomendações da página atual em layout responsivo
+    page = get_page_slice("recommendations_page", len(recommendations))
+    render_listing(
+        ("recommendations", language, selected_filter, page.start, page.stop),
+        lambda: recommendation_list_html(recommendations[page], language, catalog, filter_options)
+    )
+    
+    render_pagination("recommendations_page", len(recommendations), catalog)
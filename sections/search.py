@@ -0,0 +1,57 @@
+"""Resultados da busca textual sobre projetos, conteúdos e recomendações."""
+
+import streamlit as st
+from data.translations import Catalog
+from data.search import search
+from components.buttons import create_custom_button
+from components.instrumentation import instrumented
+
+
+@st.fragment
+@instrumented("section:search")
+def render_search_results(query: str, language: str, catalog: Catalog) -> None:
+    """
+    Renderiza os resultados da busca em projetos, conteúdos e recomendações.
+    
+    Usa o índice invertido de data/search.py, construído uma vez por idioma.
+    
+    Args:
+        query: Consulta digitada pelo usuário
+        language: Código do idioma ('pt' ou 'en')
+        catalog: Catálogo de traduções compilado do idioma
+    """
+    st.title(catalog.search_results)
+    st.caption(f"🔎 {query}")
+    
+    results = search(query, language)
+    if not results:
+        st.info(catalog.search_empty)
+        return
+    
+    kind_labels = {
+        "project": catalog.search_kind_project,
+        "content": catalog.search_kind_content,
+        "recommendation": catalog.search_kind_recommendation
+    }
+    view_labels = {
+        "project": catalog.projects_view,
+        "content": catalog.content_view,
+        "recommendation": catalog.recommendations_access
+    }
+    
+    for result in results:
+        record = result.record
+        with st.container():
+            st.subheader(record.text("title", language))
+            st.markdown(f"**{kind_labels[result.kind]}**")
+            description = record.text("description", language)
+            if description:
+                st.markdown(description)
+            if record.url:
+                create_custom_button(
+                    text=view_labels[result.kind],
+                    url=record.url,
+                    background_color="#0066cc",
+                    text_color="#ffffff"
+                )
+            st.divider()